@@ -1,5 +1,5 @@
 """Configuration module for GEO-AUDITOR AI."""
 
-from .settings import Settings, get_settings, load_scoring_weights
+from .settings import SETTINGS, Settings, dimension_weight, get_settings, load_scoring_weights
 
-__all__ = ["Settings", "get_settings", "load_scoring_weights"]
+__all__ = ["SETTINGS", "Settings", "dimension_weight", "get_settings", "load_scoring_weights"]
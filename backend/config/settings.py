@@ -5,15 +5,45 @@ Centralized configuration module for the application.
 Follows 12-factor app principles with environment variable support.
 """
 
-import json
+import os
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from functools import lru_cache
+from functools import lru_cache, cached_property
+from types import MappingProxyType
 from typing import Optional
-from pydantic_settings import BaseSettings
+import orjson
+from dotenv import dotenv_values
 
 
-class Settings(BaseSettings):
-    """Application settings with environment variable support."""
+ENV_PREFIX = "GEO_AUDITOR_"
+ENV_FILE = ".env"
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse common truthy/falsy strings ("true", "1", "yes", "on")."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Converters from raw environment strings to each field's declared type
+_ENV_PARSERS = {
+    str: str,
+    Optional[str]: str,
+    int: int,
+    bool: _parse_bool,
+    list[str]: orjson.loads,
+    Path: Path,
+}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings with environment variable support.
+    
+    Each field can be overridden by a GEO_AUDITOR_<FIELD> variable,
+    read from the process environment or a local .env file.
+    """
     
     # API Configuration
     app_name: str = "GEO-AUDITOR AI"
@@ -27,14 +57,19 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
+    # uvloop ships with uvicorn[standard] everywhere except Windows
+    event_loop: str = "asyncio" if sys.platform == "win32" else "uvloop"
     
     # CORS Configuration
     # In production, set GEO_AUDITOR_CORS_ORIGINS='["https://your-frontend.vercel.app"]'
-    cors_origins: list[str] = ["http://localhost:3000", "https://carloscanofernandez.com", "http://carloscanofernandez.com"]
+    cors_origins: list[str] = field(default_factory=lambda: ["http://localhost:3000", "https://carloscanofernandez.com", "http://carloscanofernandez.com"])
     
     # Scraping Configuration
     scraper_timeout_ms: int = 30000
-    scraper_wait_until: str = "networkidle"
+    scraper_wait_until: str = "domcontentloaded"
+    scraper_post_load_selector: Optional[str] = None  # e.g. "article p" for JS-rendered pages
+    scraper_selector_timeout_ms: int = 5000
+    scraper_pool_size: int = 4  # Max concurrent scrapes on the shared browser (one fresh context each)
     max_content_length: int = 5000000  # 5MB max
     
     # Performance Targets (from SRS)
@@ -43,36 +78,82 @@ class Settings(BaseSettings):
     # Scoring Configuration
     scoring_weights_path: Path = Path(__file__).parent / "scoring_weights.json"
     
-    class Config:
-        env_prefix = "GEO_AUDITOR_"
-        env_file = ".env"
+    @classmethod
+    def from_env(cls, env_file: Optional[str] = ENV_FILE) -> "Settings":
+        """
+        Build settings from the environment.
+        
+        Process environment variables take precedence over the .env file.
+        Variable names are matched case-insensitively.
+        
+        Args:
+            env_file: Optional path to a dotenv file
+            
+        Returns:
+            Settings instance with overrides applied
+        """
+        environ = dict(dotenv_values(env_file)) if env_file and os.path.exists(env_file) else {}
+        environ.update(os.environ)
+        environ = {key.upper(): value for key, value in environ.items()}
+        
+        overrides = {}
+        for f in fields(cls):
+            value = environ.get(ENV_PREFIX + f.name.upper())
+            if value is not None:
+                overrides[f.name] = _ENV_PARSERS[f.type](value)
+        return cls(**overrides)
     
-    @property
-    def scoring_weights(self) -> dict:
-        """Load scoring weights from JSON config file."""
+    @cached_property
+    def scoring_weights(self) -> MappingProxyType:
+        """Load scoring weights from JSON config file (cached per instance)."""
         return load_scoring_weights(self.scoring_weights_path)
+    
+    @cached_property
+    def scoring_version(self) -> str:
+        """Scoring algorithm version declared in the weights config."""
+        return self.scoring_weights.get("scoring_version", "v2.0-feb2026")
 
 
 @lru_cache()
-def load_scoring_weights(path: Path) -> dict:
+def load_scoring_weights(path: Path) -> MappingProxyType:
     """
     Load and cache scoring weights from JSON file.
     
+    The cached result is shared by every caller, so it is returned
+    as a read-only mapping.
+    
     Args:
         path: Path to the scoring_weights.json file
         
     Returns:
-        Dictionary containing scoring weights for all dimensions
+        Read-only mapping containing scoring weights for all dimensions
         
     Raises:
         FileNotFoundError: If the weights file doesn't exist
-        json.JSONDecodeError: If the file contains invalid JSON
+        orjson.JSONDecodeError: If the file contains invalid JSON
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return MappingProxyType(orjson.loads(f.read()))
+
+
+# Settings are immutable for the process lifetime, so load them once at import
+SETTINGS = Settings.from_env()
 
 
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached application settings instance."""
-    return Settings()
+    """Get the application settings instance."""
+    return SETTINGS
+
+
+@lru_cache()
+def dimension_weight(dimension: str, default: float) -> float:
+    """
+    Get the configured weight of one scoring dimension, cached per dimension.
+    
+    Falls back to default when the weights file or the entry is missing.
+    """
+    try:
+        dimensions = get_settings().scoring_weights.get("dimensions", {})
+        return dimensions.get(dimension, {}).get("weight", default)
+    except Exception:
+        return default
@@ -12,11 +12,20 @@ API Endpoints:
 CORS is configured to allow the Next.js frontend (localhost:3000).
 """
 
+import asyncio
+import html
+import logging
+import logging.handlers
+import queue
+import re
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from contextlib import asynccontextmanager
+from functools import lru_cache
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 from config.settings import get_settings
 from src.models.schemas import (
@@ -30,7 +39,20 @@ from src.models.schemas import (
 from src.scrapers.playwright_scraper import PlaywrightScraper
 from src.scrapers.base_scraper import ScraperError
 from src.detectors.infrastructure import InfrastructureDetector
+from src.detectors.metadata import MetadataDetector
+from src.detectors.aeo_structure import AEOStructureDetector
+from src.detectors.entity import EntityDetector
 from src.detectors.evidence_density import EvidenceDensityDetector
+from src.detectors.authority import AuthorityDetector
+from src.detectors.formatting import FormattingDetector
+from src.detectors.freshness import FreshnessDetector
+from src.detectors.links import LinksDetector
+
+
+logger = logging.getLogger(__name__)
+
+# Whitespace-delimited word tokens (same boundaries as str.split())
+WORD_PATTERN = re.compile(r'\S+')
 
 
 # Global scraper instance (reused across requests for performance)
@@ -42,14 +64,41 @@ async def lifespan(app: FastAPI):
     """
     Application lifespan manager.
     
-    Initializes and cleans up resources like the Playwright browser.
+    Configures logging and initializes/cleans up resources like the
+    Playwright browser.
     """
     global scraper
-    scraper = PlaywrightScraper()
-    yield
-    # Cleanup
-    if scraper:
-        await scraper.close()
+    # Records are formatted by the QueueHandler and written to stderr by a
+    # background listener thread, so logging never blocks the event loop
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    # The root handlers installed by uvicorn/the host are set aside (not
+    # closed) and put back on shutdown
+    root_logger = logging.getLogger()
+    previous_handlers = root_logger.handlers[:]
+    previous_level = root_logger.level
+    for handler in previous_handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+    log_listener.start()
+    try:
+        scraper = PlaywrightScraper()
+        yield
+        # Cleanup
+        if scraper:
+            await scraper.close()
+    finally:
+        root_logger.removeHandler(queue_handler)
+        for handler in previous_handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(previous_level)
+        # Flushes the records still queued
+        log_listener.stop()
 
 
 # Initialize FastAPI app
@@ -62,6 +111,42 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+
+@lru_cache()
+def scoring_weights_json() -> bytes:
+    """
+    Serialize the scoring weights once, on first request.
+
+    Scoring weights never change at runtime. Loading them lazily keeps a
+    missing or malformed config a request-time error, not an import one.
+    """
+    return orjson.dumps(dict(settings.scoring_weights))
+
+
+# Detector dispatch table: (detector, requires_url).
+# Detector instances are stateless, so they are built once at startup
+# and shared across requests. Table order is the response order.
+DETECTOR_TABLE = (
+    # --- Layer 1: Technical Infrastructure (12%) --- URL-based audits only
+    (InfrastructureDetector(), True),
+    # --- Layer 2: Metadata (10%) ---
+    (MetadataDetector(), False),
+    # --- Layer 3: AEO Structure (18%) ---
+    (AEOStructureDetector(), False),
+    # --- Layer 6: Entity Identification (8%) ---
+    (EntityDetector(), False),
+    # --- Layer 4: Evidence Mapping (15%) ---
+    (EvidenceDensityDetector(), False),
+    # --- Layer 5: E-E-A-T Authority (15%) ---
+    (AuthorityDetector(), False),
+    # --- Layer 8: Formatting & UX (10%) ---
+    (FormattingDetector(), False),
+    # --- Layer 7: Freshness (10%) ---
+    (FreshnessDetector(), False),
+    # --- Layer 9: Links & Verifiability (10%) ---
+    (LinksDetector(), False),
+)
+
 # Configure CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -72,6 +157,21 @@ app.add_middleware(
 )
 
 
+# Health timestamps only need second resolution; format once per second
+_health_ts_second: int = 0
+_health_ts_iso: str = ""
+
+
+def _health_timestamp() -> str:
+    """Return the current UTC time (ISO 8601), cached per second."""
+    global _health_ts_second, _health_ts_iso
+    now = int(time.time())
+    if now != _health_ts_second:
+        _health_ts_second = now
+        _health_ts_iso = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+    return _health_ts_iso
+
+
 @app.get("/api/health")
 async def health_check():
     """
@@ -83,7 +183,7 @@ async def health_check():
     return {
         "status": "healthy",
         "version": settings.app_version,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _health_timestamp(),
     }
 
 
@@ -96,9 +196,9 @@ async def get_scoring_weights():
     Useful for frontend visualization and transparency.
     
     Returns:
-        dict: Scoring weights configuration
+        Response: Pre-serialized JSON scoring weights configuration
     """
-    return settings.scoring_weights
+    return Response(content=scoring_weights_json(), media_type="application/json")
 
 
 @app.post("/api/audit", response_model=AuditResponse)
@@ -122,37 +222,43 @@ async def audit_url(request: AuditRequest):
         HTTPException: If URL cannot be scraped or analyzed
     """
     global scraper
-    start_time = time.time()
-    # url is optional now, mostly for logging/referencing if provided
-    url = str(request.url) if request.url else "text-mode"
+    start_ns = time.perf_counter_ns()
+    # url is optional now, mostly for logging/referencing if provided.
+    # AuditRequest.url is already a plain str, so it is read once and reused.
+    request_url = request.url
+    url = request_url or "text-mode"
     
     # Step 1: Acquisition (Scrape or use provided text)
     try:
         if request.content_text:
             # Text-only mode: Mock PageData
-            # We construct a synthetic PageData object to feed the detectors
-            text_len = len(request.content_text.split())
+            # We construct a synthetic PageData object to feed the detectors.
+            # For pure text input, AEO structure might score low on H2s unless we infer them.
+            # For now, we wrap the whole (escaped) text in a generic body and use the
+            # same document as raw and rendered HTML: there is no JS to execute.
+            # Ideally, the frontend should send HTML if it's a rich editor, but "Paste Text" implies plain text.
+            content_text = request.content_text
+            text_html = (
+                "<html><body><h1>Analysis</h1><div class='content'>"
+                + html.escape(content_text, quote=False)
+                + "</div></body></html>"
+            )
+            input_url = request_url or "https://manual-input.local"
             page_data = PageData(
-                url=request.url or "https://manual-input.local",
-                final_url=request.url or "https://manual-input.local",
-                html_raw=f"<html><body><h1>Analysis</h1><p>{request.content_text}</p></body></html>",
-                # Wrap text in paragraphs for basic structure simulation if needed, 
-                # but AEO detector works better with structure. 
-                # For pure text input, AEO structure might score low on H2s unless we infer them.
-                # For now, we wrap the whole text in a generic body. 
-                # Ideally, the frontend should send HTML if it's a rich editor, but "Paste Text" implies plain text.
-                # sophisticated text-to-html could be done here, but let's keep it simple.
-                html_rendered=f"<html><body><h1>Analysis</h1><div class='content'>{request.content_text}</div></body></html>",
-                text_content=request.content_text,
+                url=input_url,
+                final_url=input_url,
+                html_raw=text_html,
+                html_rendered=text_html,
+                text_content=content_text,
                 status_code=200,
                 load_time_ms=0,
-                word_count=text_len,
+                word_count=sum(1 for _ in WORD_PATTERN.finditer(content_text)),
                 is_ssr=True,  # Assume readable
                 is_https=True # Assume secure
             )
-        elif request.url:
+        elif request_url:
             # URL mode: Scrape
-            page_data = await scraper.scrape(request.url)
+            page_data = await scraper.scrape(request_url)
         else:
             raise HTTPException(status_code=400, detail="Must provide either URL or content_text")
             
@@ -168,124 +274,44 @@ async def audit_url(request: AuditRequest):
         )
     
     # Step 2: Run detectors
-    detector_results = []
-    all_recommendations = []
-    
-    # --- Layer 1: Technical Infrastructure (12%) ---
-    # Only run for URL-based audits
-    if not request.content_text:
-        try:
-            infra_detector = InfrastructureDetector()
-            infra_result = await infra_detector.analyze(page_data)
-            detector_results.append(infra_result)
-            for breakdown in infra_result.breakdown:
-                all_recommendations.extend(breakdown.recommendations)
-        except Exception as e:
-            print(f"Infrastructure detector error: {e}")
-
-    # --- Layer 2: Metadata (10%) ---
-    try:
-        from src.detectors.metadata import MetadataDetector
-        metadata_detector = MetadataDetector()
-        metadata_result = await metadata_detector.analyze(page_data)
-        detector_results.append(metadata_result)
-        for breakdown in metadata_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Metadata detector error: {e}")
-
-    # --- Layer 3: AEO Structure (18%) ---
-    try:
-        from src.detectors.aeo_structure import AEOStructureDetector
-        aeo_detector = AEOStructureDetector()
-        aeo_result = await aeo_detector.analyze(page_data)
-        detector_results.append(aeo_result)
-        for breakdown in aeo_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"AEO Structure detector error: {e}")
-
-    # --- Layer 6: Entity Identification (8%) ---
-    try:
-        from src.detectors.entity import EntityDetector
-        entity_detector = EntityDetector()
-        entity_result = await entity_detector.analyze(page_data)
-        detector_results.append(entity_result)
-        for breakdown in entity_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Entity detector error: {e}")
-
-    # --- Layer 4: Evidence Mapping (15%) ---
-    try:
-        evidence_detector = EvidenceDensityDetector()
-        evidence_result = await evidence_detector.analyze(page_data)
-        detector_results.append(evidence_result)
-        for breakdown in evidence_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Evidence detector error: {e}")
-
-    # --- Layer 5: E-E-A-T Authority (15%) ---
-    try:
-        from src.detectors.authority import AuthorityDetector
-        authority_detector = AuthorityDetector()
-        authority_result = await authority_detector.analyze(page_data)
-        detector_results.append(authority_result)
-        for breakdown in authority_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Authority detector error: {e}")
-
-    # --- Layer 8: Formatting & UX (10%) ---
-    try:
-        from src.detectors.formatting import FormattingDetector
-        formatting_detector = FormattingDetector()
-        formatting_result = await formatting_detector.analyze(page_data)
-        detector_results.append(formatting_result)
-        for breakdown in formatting_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Formatting detector error: {e}")
+    # Detectors are independent and only read the immutable PageData,
+    # so they are dispatched together and awaited as a group.
+    is_text_mode = bool(request.content_text)
+    detectors = [
+        detector
+        for detector, requires_url in DETECTOR_TABLE
+        if not (requires_url and is_text_mode)
+    ]
 
-    # --- Layer 7: Freshness (10%) ---
-    try:
-        from src.detectors.freshness import FreshnessDetector
-        freshness_detector = FreshnessDetector()
-        freshness_result = await freshness_detector.analyze(page_data)
-        detector_results.append(freshness_result)
-        for breakdown in freshness_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Freshness detector error: {e}")
+    results = await asyncio.gather(
+        *(detector.analyze(page_data) for detector in detectors),
+        return_exceptions=True,
+    )
 
-    # --- Layer 9: Links & Verifiability (10%) ---
-    try:
-        from src.detectors.links import LinksDetector
-        links_detector = LinksDetector()
-        links_result = await links_detector.analyze(page_data)
-        detector_results.append(links_result)
-        for breakdown in links_result.breakdown:
-            all_recommendations.extend(breakdown.recommendations)
-    except Exception as e:
-        print(f"Links detector error: {e}")
+    # Step 3: Collect results, total score and top 5 recommendations
+    # (in detector order) in a single pass
+    detector_results = []
+    total_score = 0.0
+    top_recommendations = []
+    for detector, result in zip(detectors, results):
+        # BaseException: a cancelled detector comes back as CancelledError
+        if isinstance(result, BaseException):
+            logger.error(
+                "%s detector failed", type(detector).__name__, exc_info=result
+            )
+            continue
+        detector_results.append(result)
+        total_score += result.contribution
+        for breakdown in result.breakdown:
+            if len(top_recommendations) >= 5:
+                break
+            top_recommendations.extend(
+                breakdown.recommendations[:5 - len(top_recommendations)]
+            )
 
-    # TODO: Add remaining detectors in future phases
-    # - EEATDetector (Layer 5) 
-    # - FreshnessDetector (Layer 7)
-    # - FormatDetector (Layer 8)
-    # - LinksDetector (Layer 9)
+    # TODO: Add remaining detectors to DETECTOR_TABLE in future phases
     # - MultiPlatformDetector (Layer 10)
     
-    # Step 3: Calculate total score
-    total_score = sum(r.contribution for r in detector_results)
-    
-    # For now, scale up since we only have 1 of 10 detectors
-    # This shows the infrastructure score at its full weight
-    if detector_results:
-        # Show the actual infrastructure contribution
-        pass
-    
     # Step 4: Build dimension scores for response
     dimension_scores = [
         DimensionScore(
@@ -299,13 +325,10 @@ async def audit_url(request: AuditRequest):
     ]
     
     # Calculate analysis time
-    analysis_time_ms = (time.time() - start_time) * 1000
+    analysis_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     
     # Get scoring version
-    scoring_version = settings.scoring_weights.get("scoring_version", "v2.0-feb2026")
-    
-    # Prioritize recommendations (show top 5)
-    top_recommendations = all_recommendations[:5]
+    scoring_version = settings.scoring_version
     
     return AuditResponse(
         url=url,
@@ -342,5 +365,6 @@ if __name__ == "__main__":
         "main:app",
         host=settings.host,
         port=settings.port,
+        loop=settings.event_loop,
         reload=settings.debug,
     )
@@ -16,11 +16,55 @@ Implementation uses regex patterns as recommended in best practices:
 "Usar Regex patterns customizados: Detectar frases de experiencia"
 """
 
+import asyncio
+import logging
 import re
 from typing import Optional
+from bs4 import BeautifulSoup
 from src.models.schemas import PageData, DetectorResult, ScoreBreakdown
 from src.detectors.base_detector import BaseDetector
-from config.settings import get_settings
+from src.utils.text_processing import (
+    clean_tree_for_analysis,
+    count_normalized_words,
+    count_words_by_section_from_tree,
+    extract_clean_text_from_tree,
+    extract_headers_from_tree,
+    extract_substantive_paragraphs_from_tree,
+    parse_html,
+)
+from config.settings import dimension_weight
+
+
+logger = logging.getLogger(__name__)
+
+# Compiled once at import; the analyzers run these against every page
+_FACTUAL_ACTION_RE = re.compile(
+    r'\b(?:soared|surged|rose|fell|dropped|climbed|increased|decreased|jumped|plunged'
+    r'|announced|reported|revealed|confirmed|launched|released|secured|achieved'
+    r'|traded|surpassed|reached|exceeded|hit|gained|lost|outperformed)\b'
+)
+# Every verb above ends in "ed" or is one of these; a paragraph without any of
+# the substrings cannot match, so the regex is skipped
+_FACTUAL_ACTION_HINTS = ("ed", "rose", "fell", "hit", "lost")
+_NUMERIC_RE = re.compile(r'(\$[\d,.]+|\d+%|\d{1,3}(,\d{3})+|\d+\.\d+)')
+_TICKER_RE = re.compile(r'\$[A-Z]{2,}')
+_SENTENCE_BREAK_RE = re.compile(r'[.!?]\s+')
+# A word whose ASCII letters start with an uppercase one and number at least 3
+# (i.e. the letters-only form is a capitalized word longer than 2 characters)
+_PROPER_NOUN_RE = re.compile(r'[^a-zA-Z]*[A-Z](?:[^a-zA-Z]*[a-zA-Z]){2}')
+
+# Rule of 60 phrase lists; tuples so str.startswith can take them directly
+_DEFINITION_PHRASES = (
+    "is defined as", "refers to", "is a type of", "consists of",
+    "is the process of", "is a primary", "represents a",
+)
+_NARRATIVE_STARTS = (
+    "in today's world", "we are used to", "looking back",
+    "have you ever", "imagine if", "since the beginning", "nowadays",
+    "once upon a time", "imagine a world", "it all started",
+)
+# Folds sentence terminators onto '.' so a plain str.split('.') segments the text
+_SENTENCE_END_TO_PERIOD = str.maketrans('!?', '..')
 
 
 class AEOStructureDetector(BaseDetector):
@@ -48,7 +92,7 @@ class AEOStructureDetector(BaseDetector):
     """
     
     dimension_name: str = "aeo_structure"
-    weight: float = 0.18
+    weight: float = dimension_weight("aeo_structure", 0.18)  # From config if available
     
     # Sub-dimension weights (Redistributed for 7 metrics)
     RULE_60_WEIGHT = 0.20           # Was 0.30
@@ -101,27 +145,29 @@ class AEOStructureDetector(BaseDetector):
         'therefore', 'however', 'because', 'thus', 'consequently', 
         'furthermore', 'in contrast', 'for example', 'as a result', 'since'
     ]
+    # One scan finds every connector; word boundaries as in the per-connector check
+    LOGICAL_CONNECTORS_RE = re.compile(
+        r'\b(' + '|'.join(re.escape(c) for c in LOGICAL_CONNECTORS) + r')\b'
+    )
 
     # NEW: Generic Headers Blacklist
-    GENERIC_HEADERS_BLACKLIST = [
+    GENERIC_HEADERS_BLACKLIST = frozenset({
         'introduction', 'conclusion', 'summary', 'overview', 
         'final thoughts', 'background', 'the basics'
-    ]
+    })
     
-    def __init__(self):
-        """Initialize with settings."""
-        self.settings = get_settings()
+    async def analyze(self, page_data: PageData) -> DetectorResult:
+        """
+        Analyze AEO structure of the content.
         
-        # Load weights from config if available
-        try:
-            weights = self.settings.scoring_weights
-            aeo_config = weights.get("dimensions", {}).get("aeo_structure", {})
-            self.weight = aeo_config.get("weight", self.weight)
-        except Exception:
-            pass
+        Parsing and the seven sub-metrics are synchronous CPU work, so they
+        run in a worker thread to keep the event loop free for concurrent
+        scrapes and requests.
+        """
+        return await asyncio.to_thread(self._analyze_sync, page_data)
     
-    async def analyze(self, page_data: PageData) -> DetectorResult:
-        """Analyze AEO structure of the content."""
+    def _analyze_sync(self, page_data: PageData) -> DetectorResult:
+        """Run the full AEO analysis; see analyze()."""
         errors: list[str] = []
         breakdown: list[ScoreBreakdown] = []
         
@@ -132,6 +178,7 @@ class AEOStructureDetector(BaseDetector):
         h2_texts = []
         h1_text = ""
         scoped_text = ""
+        scoped_word_count = 0
         avg_sentence_length = 0.0
         connector_count = 0
         
@@ -139,13 +186,14 @@ class AEOStructureDetector(BaseDetector):
             # Use HTML from PageData (rendered if available for JS content, else raw)
             html = page_data.html_rendered
             
-            # Prepare scoped HTML for analysis
-            from src.utils.text_processing import clean_html_for_analysis
-            scoped_html = clean_html_for_analysis(html)
+            # Parse once; every extraction below reads from this tree
+            soup = parse_html(html)
             
             # EXTRACT HEADERS (Simplified Logic)
-            from src.utils.text_processing import extract_headers
-            all_headers = extract_headers(html) # Use full HTML for headers to avoid losing them in scoping
+            all_headers = extract_headers_from_tree(soup) # Read headers before scoping to avoid losing them
+            
+            # Scope the same tree in place for the remaining analysis
+            scoped_soup = clean_tree_for_analysis(soup)
             
             # Filter for specific levels
             h1_headers = [h for h in all_headers if h['tag'] == 'h1']
@@ -158,12 +206,14 @@ class AEOStructureDetector(BaseDetector):
             h1_text = h1_headers[0]['text'] if h1_headers else ""
             
             # EXTRACT SCOPED TEXT (Centralized)
-            from src.utils.text_processing import extract_clean_text
-            scoped_text = extract_clean_text(scoped_html)
+            scoped_text = extract_clean_text_from_tree(scoped_soup)
+            # Shared by the sub-analyzers so the text is lowered/split only once
+            scoped_text_lower = scoped_text.lower()
+            scoped_word_count = count_normalized_words(scoped_text)
             
             # 1. Regla de 60 Check (Uses scoped text)
             try:
-                rule_60_result = self._analyze_rule_of_60(scoped_text, scoped_html, h1_text)
+                rule_60_result = self._analyze_rule_of_60(scoped_text, scoped_soup, h1_text)
                 breakdown.append(rule_60_result)
             except Exception as e:
                 errors.append(f"Rule of 60 check failed: {str(e)}")
@@ -180,15 +230,15 @@ class AEOStructureDetector(BaseDetector):
             # 3. Heading Structure Check
             try:
                 # Use scoped text word count for more accurate ratio
-                structure_result = self._analyze_heading_structure(len(h2_headers), len(h3_headers), scoped_text)
+                structure_result = self._analyze_heading_structure(len(h2_headers), len(h3_headers), scoped_word_count)
                 breakdown.append(structure_result)
             except Exception as e:
                 errors.append(f"Heading structure check failed: {str(e)}")
                 breakdown.append(self._create_error_breakdown("Heading Structure", self.HEADING_STRUCTURE_WEIGHT))
             
-            # 4. Text Walls Check (Uses SCOPED html)
+            # 4. Text Walls Check (Uses SCOPED tree)
             try:
-                walls_result = self._analyze_text_walls(scoped_html)
+                walls_result = self._analyze_text_walls(scoped_soup)
                 breakdown.append(walls_result)
             except Exception as e:
                 errors.append(f"Text walls check failed: {str(e)}")
@@ -205,7 +255,7 @@ class AEOStructureDetector(BaseDetector):
     
             # 6. Logical Connectors Check (NEW)
             try:
-                connectors_result, count_val = self._analyze_logical_connectors(scoped_text)
+                connectors_result, count_val = self._analyze_logical_connectors(scoped_text, scoped_text_lower)
                 connector_count = count_val
                 breakdown.append(connectors_result)
             except Exception as e:
@@ -223,8 +273,7 @@ class AEOStructureDetector(BaseDetector):
         except Exception as e:
             # Global catch-all to prevent module crash
             # Ensure we return at least a basic result if everything explodes
-            import traceback
-            traceback.print_exc() # Log to stderr
+            logger.warning("Critical error in AEO module", exc_info=True)
             errors.append(f"Critical error in AEO module: {str(e)}")
             
             # Try to salvage headers if possible
@@ -243,7 +292,7 @@ class AEOStructureDetector(BaseDetector):
             "h2_count": len(h2_headers),
             "h3_count": len(h3_headers),
             "h1_text": h1_text,
-            "total_words": len(scoped_text.split()) if scoped_text else 0,
+            "total_words": scoped_word_count,
             "avg_sentence_length": avg_sentence_length,
             "connector_count": connector_count
         }
@@ -262,7 +311,7 @@ class AEOStructureDetector(BaseDetector):
             }
         )
     
-    def _analyze_rule_of_60(self, text: str, html: str, h1_text: str = "") -> ScoreBreakdown:
+    def _analyze_rule_of_60(self, text: str, soup: BeautifulSoup, h1_text: str = "") -> ScoreBreakdown:
         """
         Rule of 60: Evaluate first paragraph quality for LLM citability.
         
@@ -287,15 +336,14 @@ class AEOStructureDetector(BaseDetector):
         
         Args:
             text: Clean text content of the page
-            html: HTML content for paragraph extraction
+            soup: Parsed (scoped) HTML tree for paragraph extraction
             h1_text: The H1 heading text (for context)
             
         Returns:
             ScoreBreakdown with Rule of 60 evaluation
         """
         # Extract the substantive paragraphs using robust utility
-        from src.utils.text_processing import extract_substantive_paragraphs
-        substantive_paragraphs = extract_substantive_paragraphs(html, min_words=10)
+        substantive_paragraphs = extract_substantive_paragraphs_from_tree(soup, min_words=10)
         
         first_p_text = substantive_paragraphs[0] if substantive_paragraphs else ""
         
@@ -309,7 +357,6 @@ class AEOStructureDetector(BaseDetector):
                 recommendations=["Add an introductory paragraph starting with a direct definition."],
             )
         
-        words = first_p_text.split()
         first_p_lower = first_p_text.lower()
         
         raw_score = 0.0
@@ -317,59 +364,26 @@ class AEOStructureDetector(BaseDetector):
         recommendations = []
         
         # 1. PERFECT SCORE: Explicit Definition Verbs
-        val_definition_verbs = [
-            "is defined as", "refers to", "is a type of", "consists of", 
-            "is the process of", "is a primary", "represents a"
-        ]
+        has_definition = any(phrase in first_p_lower for phrase in _DEFINITION_PHRASES)
         
-        has_definition = any(verb in first_p_lower for verb in val_definition_verbs)
+        # 3. NARRATIVE PENALTY: Filler starts
+        is_narrative = first_p_lower.startswith(_NARRATIVE_STARTS)
         
         # 2. STRONG FACTUAL LEAD: News/analysis style with data and action verbs
-        # Detects information-dense intros typical of news, market analysis, reports
-        factual_action_verbs = [
-            r'\b(soared|surged|rose|fell|dropped|climbed|increased|decreased|jumped|plunged)\b',
-            r'\b(announced|reported|revealed|confirmed|launched|released|secured|achieved)\b',
-            r'\b(traded|surpassed|reached|exceeded|hit|gained|lost|outperformed)\b',
-        ]
-        has_action_verb = any(
-            re.search(pattern, first_p_lower) for pattern in factual_action_verbs
-        )
-        
-        # Numeric data signals: $X, X%, numbers, percentages
-        has_numeric_data = bool(re.search(
-            r'(\$[\d,.]+|\d+%|\d{1,3}(,\d{3})+|\d+\.\d+)', first_p_text
-        ))
-        
-        # Named entities: words starting with uppercase (excluding sentence starts),
-        # or ticker symbols ($GAL, $BTC)
-        has_ticker_symbols = bool(re.search(r'\$[A-Z]{2,}', first_p_text))
-        
-        # Count capitalized proper nouns (skip first word of sentences)
-        sentences_in_p = re.split(r'[.!?]\s+', first_p_text)
-        proper_noun_count = 0
-        for sent in sentences_in_p:
-            sent_words = sent.split()
-            # Skip first word (starts sentence), check rest for capitalized words
-            for w in sent_words[1:]:
-                clean_w = re.sub(r'[^a-zA-Z]', '', w)
-                if clean_w and clean_w[0].isupper() and len(clean_w) > 2:
-                    proper_noun_count += 1
-        has_named_entities = proper_noun_count >= 2 or has_ticker_symbols
-        
-        # A factual lead needs at least 2 of: action verbs, numeric data, named entities
-        factual_signals = sum([has_action_verb, has_numeric_data, has_named_entities])
-        is_factual_lead = factual_signals >= 2
-        
-        # 3. NARRATIVE PENALTY: Filler starts
-        narrative_starts = [
-            "in today's world", "we are used to", "looking back",
-            "have you ever", "imagine if", "since the beginning", "nowadays",
-            "once upon a time", "imagine a world", "it all started"
-        ]
-        is_narrative = any(first_p_lower.startswith(start) for start in narrative_starts)
+        # Only decides the tier when there is no definition and no narrative
+        # start, so the signal scan is skipped otherwise
+        has_action_verb = has_numeric_data = has_named_entities = False
+        is_factual_lead = False
+        if not has_definition and not is_narrative:
+            has_action_verb, has_numeric_data, has_named_entities = self._factual_lead_signals(
+                first_p_text, first_p_lower
+            )
+            # A factual lead needs at least 2 of: action verbs, numeric data, named entities
+            factual_signals = sum([has_action_verb, has_numeric_data, has_named_entities])
+            is_factual_lead = factual_signals >= 2
         
         # 4. WORD COUNT CHECK
-        is_too_long = len(words) > 60
+        is_too_long = len(first_p_text.split()) > 60
         
         # Scoring Logic (prioritized tiers)
         if has_definition and not is_narrative:
@@ -400,7 +414,7 @@ class AEOStructureDetector(BaseDetector):
             raw_score = 30.0
             explanation = "❌ Weak Intro: No explicit definition or factual lead found in first paragraph."
             recommendations.append(
-                f"Start with a direct definition ({', '.join(val_definition_verbs[:3])}) "
+                f"Start with a direct definition ({', '.join(_DEFINITION_PHRASES[:3])}) "
                 f"or a factual statement with data and action verbs."
             )
  
@@ -413,6 +427,43 @@ class AEOStructureDetector(BaseDetector):
             recommendations=recommendations,
         )
     
+    def _factual_lead_signals(self, text: str, text_lower: str) -> tuple[bool, bool, bool]:
+        """
+        Detect factual-lead signals in a first paragraph (information-dense
+        intros typical of news, market analysis, reports).
+        
+        Returns tuple: (has_action_verb, has_numeric_data, has_named_entities)
+        """
+        has_action_verb = (
+            any(hint in text_lower for hint in _FACTUAL_ACTION_HINTS)
+            and bool(_FACTUAL_ACTION_RE.search(text_lower))
+        )
+        
+        # Numeric data signals: $X, X%, numbers, percentages
+        has_numeric_data = bool(_NUMERIC_RE.search(text))
+        
+        # Named entities: words starting with uppercase (excluding sentence starts),
+        # or ticker symbols ($GAL, $BTC)
+        if '$' in text and _TICKER_RE.search(text):
+            return has_action_verb, has_numeric_data, True
+        
+        # Count capitalized proper nouns (skip first word of sentences);
+        # two are enough, so stop as soon as the second one is seen
+        proper_noun_count = 0
+        for sent in _SENTENCE_BREAK_RE.split(text):
+            sent_words = sent.split()
+            # Skip first word (starts sentence), check rest for capitalized words
+            for w in sent_words[1:]:
+                # All-lowercase words can never qualify; skip them before the regex
+                if w.islower():
+                    continue
+                if _PROPER_NOUN_RE.match(w):
+                    proper_noun_count += 1
+                    if proper_noun_count >= 2:
+                        return has_action_verb, has_numeric_data, True
+        
+        return has_action_verb, has_numeric_data, False
+    
     def _analyze_interrogative_h2s(self, h2_texts: list[str]) -> ScoreBreakdown:
         """
         Analyze if H2 headers are formatted as questions.
@@ -430,13 +481,8 @@ class AEOStructureDetector(BaseDetector):
                 ],
             )
         
-        # Count interrogative H2s
-        interrogative_count = 0
-        for h2_text in h2_texts:
-            # Check for explicit question mark AT END
-            if h2_text.strip().endswith('?'):
-                interrogative_count += 1
-                continue
+        # Count interrogative H2s: explicit question mark AT END
+        interrogative_count = sum(1 for h2_text in h2_texts if h2_text.rstrip().endswith('?'))
         
         # Calculate score
         total_h2s = len(h2_texts)
@@ -471,25 +517,14 @@ class AEOStructureDetector(BaseDetector):
             recommendations=recommendations,
         )
     
-    def _analyze_heading_structure(self, h2_count: int, h3_count: int, text: str) -> ScoreBreakdown:
+    def _analyze_heading_structure(self, h2_count: int, h3_count: int, word_count: int) -> ScoreBreakdown:
         """
         Analyze heading structure ratio.
         Per SRS Section 2.1.6: Ratio optimal: 1 H2 each 300-500 words.
         """
-        # Defensive check
-        if not text:
-             return ScoreBreakdown(
-                name="Heading Structure",
-                raw_score=0.0,
-                weight=self.HEADING_STRUCTURE_WEIGHT,
-                weighted_score=0.0,
-                explanation="No text content to analyze.",
-                recommendations=["Add text content."],
-            )
-
-        word_count = len(text.split())
         total_headings = h2_count + h3_count
         
+        # Defensive check
         if word_count == 0:
             return ScoreBreakdown(
                 name="Heading Structure",
@@ -554,21 +589,15 @@ class AEOStructureDetector(BaseDetector):
             recommendations=recommendations,
         )
     
-    def _analyze_text_walls(self, html: str) -> ScoreBreakdown:
+    def _analyze_text_walls(self, soup: BeautifulSoup) -> ScoreBreakdown:
         """Analyze for 'text walls' (>500 words without subheaders)."""
-        # Split by headers
-        header_pattern = r'<h[1-6][^>]*>'
-        sections = re.split(header_pattern, html, flags=re.IGNORECASE)
-        
-        text_walls = []
-        for i, section in enumerate(sections):
-            # Extract text from section
-            text = re.sub(r'<[^>]+>', ' ', section)
-            text = re.sub(r'\s+', ' ', text).strip()
-            word_count = len(text.split())
-            
-            if word_count > self.MAX_WORDS_WITHOUT_HEADER:
-                text_walls.append(word_count)
+        # Word counts per header-delimited section, from a single DOM walk
+        section_word_counts = count_words_by_section_from_tree(soup)
+        
+        text_walls = [
+            word_count for word_count in section_word_counts
+            if word_count > self.MAX_WORDS_WITHOUT_HEADER
+        ]
         
         recommendations = []
         
@@ -613,9 +642,10 @@ class AEOStructureDetector(BaseDetector):
                 recommendations=[],
             ), 0.0)
 
-        # Simple sentence split by punctuation
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if len(s.strip()) > 10] # Ignore short fragments
+        # Simple sentence split by punctuation (runs of terminators leave
+        # empty pieces, which the length filter drops)
+        sentences = text.translate(_SENTENCE_END_TO_PERIOD).split('.')
+        sentences = [s for s in map(str.strip, sentences) if len(s) > 10] # Ignore short fragments
         
         if not sentences:
              return (ScoreBreakdown(
@@ -658,9 +688,10 @@ class AEOStructureDetector(BaseDetector):
             recommendations=recommendations,
         ), avg_length)
 
-    def _analyze_logical_connectors(self, text: str) -> tuple[ScoreBreakdown, int]:
+    def _analyze_logical_connectors(self, text: str, text_lower: Optional[str] = None) -> tuple[ScoreBreakdown, int]:
         """
         Analyze presence of logical connectors (Cohesion).
+        Pass text_lower when the caller already has the lowercased text.
         Returns tuple: (ScoreBreakdown, count)
         """
         if not text:
@@ -673,13 +704,9 @@ class AEOStructureDetector(BaseDetector):
                 recommendations=[],
             ), 0)
 
-        text_lower = text.lower()
-        found_connectors = []
-        
-        for connector in self.LOGICAL_CONNECTORS:
-            # Check distinct word boundaries
-            if re.search(r'\b' + re.escape(connector) + r'\b', text_lower):
-                found_connectors.append(connector)
+        if text_lower is None:
+            text_lower = text.lower()
+        found_connectors = {m.group(1) for m in self.LOGICAL_CONNECTORS_RE.finditer(text_lower)}
                 
         count = len(found_connectors)
         recommendations = []
@@ -713,12 +740,11 @@ class AEOStructureDetector(BaseDetector):
         """
         Check for generic H2 headers (Banned H2s).
         """
-        bad_headers = []
-        for h2 in h2_texts:
-            h2_lower = h2.lower().strip()
-            # Exact match or very generic phrase
-            if h2_lower in self.GENERIC_HEADERS_BLACKLIST:
-                bad_headers.append(h2)
+        # Exact match against the blacklist (hash lookup per header)
+        bad_headers = [
+            h2 for h2 in h2_texts
+            if h2.lower().strip() in self.GENERIC_HEADERS_BLACKLIST
+        ]
                 
         recommendations = []
         if not bad_headers:
@@ -740,14 +766,3 @@ class AEOStructureDetector(BaseDetector):
             explanation=explanation,
             recommendations=recommendations,
         )
-
-    def _create_error_breakdown(self, name: str, weight: float) -> ScoreBreakdown:
-        """Create a zero-score breakdown for failed checks."""
-        return ScoreBreakdown(
-            name=name,
-            raw_score=0.0,
-            weight=weight,
-            weighted_score=0.0,
-            explanation=f"Error analyzing {name}. Score: 0.",
-            recommendations=[f"Manual verification required: {name}."],
-        )
@@ -5,7 +5,9 @@ Analyzes pages for signals of Authority, Expertise, and Trustworthiness.
 Focuses on identifying authors, first-person experience evidence, and trust pages.
 """
 
+import asyncio
 import re
+from itertools import islice
 from src.detectors.base_detector import BaseDetector
 from src.models.schemas import PageData, DetectorResult, ScoreBreakdown
 
@@ -22,62 +24,116 @@ class AuthorityDetector(BaseDetector):
     dimension_name = "eeat_authority"
     weight = 0.15  # 15% of total score
     
+    # Sub-dimension weights
+    AUTHORSHIP_WEIGHT = 0.40
+    EXPERIENCE_WEIGHT = 0.35
+    TRUST_PAGES_WEIGHT = 0.25
+    
     # Regex patterns for authorship - Strict: Requires triggered by words + 2 Capitalized Words (Name Surname)
-    AUTHOR_PATTERNS = [
+    # Compiled once at class load; analyze() calls .search()/.findall() on them directly
+    AUTHOR_PATTERNS = [re.compile(p) for p in (
         r"(?i:written by)\s+[A-Z][a-z]+\s+[A-Z][a-z]+",
         r"(?i:author:)\s+[A-Z][a-z]+\s+[A-Z][a-z]+",
-        r"(?i:by)\s+(?!the\b)[A-Z][a-z]+\s+[A-Z][a-z]+",
+        r"\b(?i:by)\s+(?!the\b)[A-Z][a-z]+\s+[A-Z][a-z]+",
         r"(?i:reviewed by)\s+[A-Z][a-z]+\s+[A-Z][a-z]+",
         r"(?i:fact checked by)\s+[A-Z][a-z]+\s+[A-Z][a-z]+"
-    ]
+    )]
     
     # Regex for Experience Signals (First-person verbs)
-    EXPERIENCE_PATTERNS = [
-        r"(?i)\b(i|we)\s+(tested|analyzed|found|discovered|observed|evaluated|reviewed|verified)",
-        r"(?i)\bin\s+(my|our)\s+(experience|opinion|view|analysis|testing)",
-        r"(?i)\b(i|we)\s+have\s+(used|tried|spent)",
-        r"(?i)\b(i|we)\s+personally",
-        r"(?i)\bhand-on\s+(test|review|experience)"
-    ]
+    EXPERIENCE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+        r"\b(i|we)\s+(tested|analyzed|found|discovered|observed|evaluated|reviewed|verified)",
+        r"\bin\s+(my|our)\s+(experience|opinion|view|analysis|testing)",
+        r"\b(i|we)\s+have\s+(used|tried|spent)",
+        r"\b(i|we)\s+personally",
+        r"\bhand-on\s+(test|review|experience)"
+    )]
+    
+    # Literal triggers the author patterns cannot match without ("by" also covers
+    # "written by", "reviewed by" and "fact checked by"); checked on lowercased text
+    AUTHOR_TRIGGERS = ("by", "author:")
+    
+    # Each group fused into one regex so the text is scanned once per group.
+    # The author gate is the five patterns with their triggers factored like a
+    # prefix trie: "written by", "reviewed by" and "fact checked by" all end in a
+    # standalone "by" (and a lowercase "the" can never pass [A-Z]), so it matches
+    # exactly when one of them would, with two branches to try per offset.
+    # The experience patterns never overlap each other, so findall() on the union
+    # counts exactly what the per-pattern findall() calls used to add up to.
+    AUTHOR_UNION = re.compile(r"(?:\b(?i:by)|(?i:author:))\s+[A-Z][a-z]+\s+[A-Z][a-z]+")
+    EXPERIENCE_UNION = re.compile("|".join(f"(?:{p.pattern})" for p in EXPERIENCE_PATTERNS), re.IGNORECASE)
+    
+    # Pattern 'Credential': Detects lines like "Name: Job Title"
+    # Only tried at word starts: unanchored, every letter of a long token was a new
+    # start that re-scanned the rest of it (quadratic on e.g. base64 blobs). The
+    # leftmost match is the same either way.
+    CREDENTIAL_PATTERN = re.compile(r"(?i)(?<![a-zA-Z])[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+:\s+[A-Z][a-zA-Z\s]+")
+    
+    # Author markup: rel="author" or an "author" token in a class list, either quote style
+    AUTHOR_HTML_RE = re.compile(r"""rel=["']author["']|class=["'][^"']*\bauthor\b""")
+    
+    # Trust page categories (keywords looked up inside link targets)
+    TRUST_HIGH_VALUE = ("about", "team", "editorial", "authors", "staff")
+    TRUST_BASIC = ("privacy", "terms", "policy", "legal", "contact")
+    TRUST_KEYWORDS = TRUST_HIGH_VALUE + TRUST_BASIC
+    
+    # Every quoted href value. The value is captured inside a lookahead so an
+    # href= nested in another attribute value is still reached.
+    HREF_VALUE_RE = re.compile(r"""href=['"](?=([^'"]*)['"])""", re.IGNORECASE)
 
     async def analyze(self, page_data: PageData) -> DetectorResult:
-        score = 0.0
+        """
+        Analyze E-E-A-T signals of the page.
+        
+        The checks are pure regex/string work, so they run in a worker thread
+        and the other detectors gathered with this one are not blocked behind it.
+        """
+        return await asyncio.to_thread(self._analyze_sync, page_data)
+    
+    def _analyze_sync(self, page_data: PageData) -> DetectorResult:
+        """Run the full authority analysis; see analyze()."""
         breakdown = []
         errors = []
-        recommendations = []
+        
+        html = page_data.html_rendered
+        text = page_data.text_content
         
         # 1. Authorship Verification (40%)
         # ----------------------------------------------------------------
         has_author = False
         author_match = None
         
-        # Pattern 'Credential': Detects lines like "Name: Job Title"
-        CREDENTIAL_PATTERN = r"(?i)[A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+:\s+[A-Z][a-zA-Z\s]+"
-        
-        # Check text content (Normal patterns)
-        for pattern in self.AUTHOR_PATTERNS:
-            match = re.search(pattern, page_data.text_content)
-            if match:
-                has_author = True
-                author_match = match.group(0)
-                break
-        
-        # DEEP SCAN: Check bottom 10% of text
-        if not has_author:
-            words = page_data.text_content.split()
-            bottom_10_start = int(len(words) * 0.9)
-            bottom_text = " ".join(words[bottom_10_start:])
-            
-            for pattern in self.AUTHOR_PATTERNS + [CREDENTIAL_PATTERN]:
-                match = re.search(pattern, bottom_text)
+        # Check text content (Normal patterns). Substring triggers and then the
+        # union rule out pages with no byline cheaply; on a hit the loop picks
+        # the reported match by pattern priority, as before.
+        text_lower = page_data.text_content_lower
+        has_trigger = any(t in text_lower for t in self.AUTHOR_TRIGGERS)
+        if has_trigger and self.AUTHOR_UNION.search(text):
+            for pattern in self.AUTHOR_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     has_author = True
-                    author_match = f"{match.group(0)} (Found in Footer area)"
+                    author_match = match.group(0)
                     break
+        
+        # DEEP SCAN: Check bottom 10% of text (only reached when the body scan missed)
+        if not has_author:
+            # Slice by character offset and only normalize the tail, instead of
+            # splitting the whole text into words. The patterns are unanchored, so a
+            # slice that starts mid-word still finds the same bylines.
+            bottom_text = " ".join(text[int(len(text) * 0.9):].split())
+            
+            # The author patterns already missed the full text, which contains this
+            # tail; re-running them could only hit a word cut in half by the slice,
+            # so only the credential form is new here
+            match = self.CREDENTIAL_PATTERN.search(bottom_text)
+            if match:
+                has_author = True
+                author_match = f"{match.group(0)} (Found in Footer area)"
 
         # Check HTML for rel="author" or similar meta tags if text check fails
+        # (a plain substring test first skips the regex on pages with no "author" at all)
         if not has_author:
-            if 'rel="author"' in page_data.html_rendered or 'class="author"' in page_data.html_rendered:
+            if "author" in html and self.AUTHOR_HTML_RE.search(html):
                 has_author = True
                 author_match = "Meta/HTML Attribute"
 
@@ -91,20 +147,16 @@ class AuthorityDetector(BaseDetector):
         breakdown.append(ScoreBreakdown(
             name="Authorship Verification",
             raw_score=auth_score,
-            weight=0.40,
-            weighted_score=auth_score * 0.40,
+            weight=self.AUTHORSHIP_WEIGHT,
+            weighted_score=auth_score * self.AUTHORSHIP_WEIGHT,
             explanation=f"{'✅' if has_author else '❌'} {auth_explanation}",
             recommendations=auth_recs
         ))
         
         # 2. Experience Signals (35%)
         # ----------------------------------------------------------------
-        exp_matches = []
-        for pattern in self.EXPERIENCE_PATTERNS:
-            matches = re.findall(pattern, page_data.text_content)
-            exp_matches.extend(matches)
-            
-        signal_count = len(exp_matches)
+        # Scoring only distinguishes 0 / 1-2 / 3+, so stop scanning at the third signal
+        signal_count = sum(1 for _ in islice(self.EXPERIENCE_UNION.finditer(text), 3))
         
         # Scoring logic: >3 strong, 1-2 moderate, 0 weak
         if signal_count >= 3:
@@ -117,7 +169,7 @@ class AuthorityDetector(BaseDetector):
             exp_score = 0.0
             exp_status = "Weak"
             
-        exp_explanation = f"Found {signal_count} first-person experience signals."
+        exp_explanation = f"Found {'3+' if signal_count >= 3 else signal_count} first-person experience signals."
         exp_recs = []
         if signal_count < 3:
             exp_recs.append("Use more first-person language ('I tested', 'We found') to demonstrate real experience.")
@@ -125,28 +177,21 @@ class AuthorityDetector(BaseDetector):
         breakdown.append(ScoreBreakdown(
             name="Experience Signals",
             raw_score=exp_score,
-            weight=0.35,
-            weighted_score=exp_score * 0.35,
+            weight=self.EXPERIENCE_WEIGHT,
+            weighted_score=exp_score * self.EXPERIENCE_WEIGHT,
             explanation=f"{'✅' if signal_count > 0 else '❌'} {exp_status} Experience: {exp_explanation}",
             recommendations=exp_recs
         ))
         
         # 3. Trust Pages (25%) - STRICT CRITERIA
         # ----------------------------------------------------------------
-        trust_pages_found = []
-        # Categories
-        HIGH_VALUE = ["about", "team", "editorial", "authors", "staff"]
-        BASIC = ["privacy", "terms", "policy", "legal", "contact"]
-        
-        html_lower = page_data.html_rendered.lower()
-        
-        for kw in HIGH_VALUE + BASIC:
-            if re.search(r'href=[\'"][^\'"]*?' + re.escape(kw) + r'[^\'"]*?[\'"]', html_lower):
-                trust_pages_found.append(kw)
-        
-        trust_pages_found = list(set(trust_pages_found))
-        has_high_value = any(kw in trust_pages_found for kw in HIGH_VALUE)
-        has_basic = any(kw in trust_pages_found for kw in BASIC)
+        # One pass collects the link targets; keywords are then plain substring
+        # checks on the joined targets (a single URL may hold several keywords).
+        # Only the targets are lowercased, not the whole rendered HTML.
+        hrefs = "\0".join(set(self.HREF_VALUE_RE.findall(html))).lower()
+        trust_pages_found = {kw for kw in self.TRUST_KEYWORDS if kw in hrefs}
+        has_high_value = not trust_pages_found.isdisjoint(self.TRUST_HIGH_VALUE)
+        has_basic = not trust_pages_found.isdisjoint(self.TRUST_BASIC)
         
         if has_high_value and len(trust_pages_found) >= 3:
             trust_score = 100.0
@@ -170,20 +215,19 @@ class AuthorityDetector(BaseDetector):
         breakdown.append(ScoreBreakdown(
             name="Trust Pages",
             raw_score=trust_score,
-            weight=0.25,
-            weighted_score=trust_score * 0.25,
+            weight=self.TRUST_PAGES_WEIGHT,
+            weighted_score=trust_score * self.TRUST_PAGES_WEIGHT,
             explanation=f"{'✅' if trust_score >= 70 else '⚠️' if trust_score > 0 else '❌'} {trust_explanation}",
             recommendations=trust_recs
         ))
 
-        # Calculate Total Score
-        total_contribution = sum(item.weighted_score for item in breakdown)
+        # Calculate Total Score straight from the three sub-scores
         # Normalize: Since weights sum to 1.0 (0.4+0.35+0.25), the sum is the score.
-        score = total_contribution
-        
-        # Add all recommendations to main list
-        for item in breakdown:
-            recommendations.extend(item.recommendations)
+        score = (
+            auth_score * self.AUTHORSHIP_WEIGHT
+            + exp_score * self.EXPERIENCE_WEIGHT
+            + trust_score * self.TRUST_PAGES_WEIGHT
+        )
 
         return DetectorResult(
             dimension=self.dimension_name,
@@ -11,7 +11,10 @@ con su propio detector/scorer."
 """
 
 from abc import ABC, abstractmethod
-from src.models.schemas import PageData, DetectorResult
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+from src.models.schemas import PageData, DetectorResult, ScoreBreakdown
 
 
 class BaseDetector(ABC):
@@ -38,11 +41,23 @@ class BaseDetector(ABC):
     Attributes:
         dimension_name: Human-readable name of this dimension
         weight: Contribution to total score (0-1)
+        RESULT_CACHE_SIZE: Results kept per instance, keyed on a digest of
+            the page content (0 disables). Only for detectors whose result depends on
+            html_rendered and text_content alone.
+        cache_hits / cache_misses: Result cache counters
     """
     
     dimension_name: str = "base"
     weight: float = 0.0
     
+    RESULT_CACHE_SIZE: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    
+    def __init__(self):
+        """Initialize the per-instance result cache (content digest -> result)."""
+        self._result_cache: OrderedDict[bytes, DetectorResult] = OrderedDict()
+    
     @abstractmethod
     async def analyze(self, page_data: PageData) -> DetectorResult:
         """
@@ -73,3 +88,56 @@ class BaseDetector(ABC):
             Weighted contribution to total score
         """
         return score * self.weight
+    
+    def _cached_result(self, page_data: PageData) -> Optional[DetectorResult]:
+        """
+        Return the memoized result for a page with identical content, if any.
+        
+        Re-audits of unchanged pages skip the whole analysis. The cache lives
+        in memory, so rule changes take effect on the next restart.
+        """
+        if not self.RESULT_CACHE_SIZE:
+            return None
+        
+        cache = self._result_cache
+        key = page_data.content_digest
+        result = cache.get(key)
+        if result is None:
+            self.cache_misses += 1
+            return None
+        
+        self.cache_hits += 1
+        cache.move_to_end(key)
+        return result
+    
+    def _store_result(self, page_data: PageData, result: DetectorResult) -> DetectorResult:
+        """
+        Memoize a result for _cached_result() and return it.
+        
+        Results with errors are not kept, so a transient failure is retried.
+        Cached results are shared between audits and must not be mutated.
+        """
+        if self.RESULT_CACHE_SIZE and not result.errors:
+            cache = self._result_cache
+            cache[page_data.content_digest] = result
+            if len(cache) > self.RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _create_error_breakdown(name: str, weight: float) -> ScoreBreakdown:
+        """
+        Create a zero-score breakdown for failed checks.
+        
+        Cached per (name, weight), so repeated failures of the same check
+        share one instance; callers must treat it as read-only.
+        """
+        return ScoreBreakdown(
+            name=name,
+            raw_score=0.0,
+            weight=weight,
+            weighted_score=0.0,
+            explanation=f"Error analyzing {name}. Score: 0.",
+            recommendations=[f"Manual verification required: {name}."],
+        )
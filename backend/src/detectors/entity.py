@@ -16,11 +16,71 @@ Per SRS Section 2.1.3:
 """
 
 import re
+from collections import Counter
+from dataclasses import dataclass
 from typing import Optional
+from bs4 import BeautifulSoup
 from src.models.schemas import PageData, DetectorResult, ScoreBreakdown
 from src.detectors.base_detector import BaseDetector
 from config.settings import get_settings
 
+# Fixed patterns, compiled once at import
+_TITLE_WORD_RE = re.compile(r'\b[a-z0-9]+\b')
+_DECLARATIVE_RE = re.compile(
+    r'\b(is|are|means|refers to|defined as|consists of|offers|provides|allows|announces|launches|reveals|demonstrates|shows)\b'
+)
+_DIGIT_RE = re.compile(r'\d+')
+_YEAR_RE = re.compile(r'20[2-9]\d')
+_SPECIFIC_TERMS_RE = re.compile(
+    r'\b(guide|tutorial|step by step|complete|ultimate|best|top|review|example|free|easy|how to|checklist)\b'
+)
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z0-9]+\b')
+_WORD_TOKEN_RE = re.compile(r'\w+')
+
+# Stop words, built once at import instead of per call (English)
+# Title words ignored by the Power Lead check
+_POWER_LEAD_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'to', 'in', 'with', 'for', 'and', 'or',
+    'is', 'are', 'was', 'were', 'how', 'what', 'when', 'where', 'why', 'which',
+    'best', 'top', 'guide', 'review', 'vs', 'versus', 'on', 'at', 'by'
+})
+# Title words never taken as density entities.
+# Expanded Stoplist per user request "Over, The, What, How, About, News, More"
+_DENSITY_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'to', 'in', 'is', 'are', 'how', 'what', 'for', 'with', 'and', 'or',
+    'guide', 'review', 'best', 'top', 'vs', 'over', 'about', 'news', 'more', 'this', 'that',
+    'drives', 'really', 'just', 'from', 'your', 'will', 'can', 'why', 'when', 'where', 'which',
+    'who', 'whose', 'does', 'do', 'should', 'would', 'could', 'has', 'have', 'had', 'been'
+})
+# Capitalized title starters that are not brands/names
+_COMMON_CAPS = frozenset({'The', 'A', 'An', 'How', 'What', 'Why', 'When', 'Where', 'Is', 'Are', 'Best', 'Top'})
+
+# Terms always accepted as key entities when a title word contains one.
+# Exact words hit the set; other words ("Bitcoins", "#crypto") take one
+# alternation search instead of a substring test per term.
+_ENTITY_WHITELIST = frozenset({"chiliz", "fan token", "socios.com", "bitcoin", "ethereum", "blockchain", "crypto"})
+_ENTITY_WHITELIST_RE = re.compile('|'.join(map(re.escape, sorted(_ENTITY_WHITELIST))))
+
+
+@dataclass(frozen=True)
+class _TitleSignals:
+    """
+    Title forms read by several sub-analyses, derived once per page.
+    
+    Attributes:
+        text: The H1 (or <title>) text as extracted
+        lower: Lowercased text
+        words: Whitespace-split words of the original text
+    """
+    text: str
+    lower: str
+    words: tuple[str, ...]
+    
+    @classmethod
+    def from_title(cls, title: str) -> "_TitleSignals":
+        """Build the signals for an extracted title."""
+        return cls(title, title.lower(), tuple(title.split()))
+
 
 class EntityDetector(BaseDetector):
     """
@@ -56,9 +116,14 @@ class EntityDetector(BaseDetector):
     # Thresholds
     POWER_LEAD_CHAR_LIMIT = 150  # Per SRS: First 150 characters
     MIN_ENTITY_DENSITY = 3  # Minimum key entity mentions
+    MENTION_CAP = 4  # Mentions per entity beyond which the density score cannot change
+    
+    # Result depends only on page HTML/text: memoize re-audits of the same content
+    RESULT_CACHE_SIZE = 32
     
     def __init__(self):
         """Initialize with settings."""
+        super().__init__()
         self.settings = get_settings()
         
         # Load weights from config if available
@@ -82,18 +147,22 @@ class EntityDetector(BaseDetector):
         Returns:
             DetectorResult with full breakdown and recommendations
         """
+        cached = self._cached_result(page_data)
+        if cached is not None:
+            return cached
+        
         errors: list[str] = []
         breakdown: list[ScoreBreakdown] = []
         
-        html = page_data.html_rendered
         text = page_data.text_content
         
-        # Extract title (H1)
-        title = self._extract_title(html)
+        # Extract title (H1) and its lowercased/split forms once for all checks
+        title_signals = _TitleSignals.from_title(self._extract_title(page_data.soup))
         
-        # 1. Power Lead Check
+        # 1. Power Lead Check (only the opening window is ever read)
         try:
-            power_lead_result = self._analyze_power_lead(text, title)
+            lead = text[:self.POWER_LEAD_CHAR_LIMIT]
+            power_lead_result = self._analyze_power_lead(lead, title_signals)
             breakdown.append(power_lead_result)
         except Exception as e:
             errors.append(f"Power Lead check failed: {str(e)}")
@@ -101,7 +170,7 @@ class EntityDetector(BaseDetector):
         
         # 2. Title Entity Check
         try:
-            title_result = self._analyze_title_entities(title)
+            title_result = self._analyze_title_entities(title_signals)
             breakdown.append(title_result)
         except Exception as e:
             errors.append(f"Title entity check failed: {str(e)}")
@@ -110,7 +179,9 @@ class EntityDetector(BaseDetector):
         # 3. Entity Density Check
         detected_entities = []
         try:
-            density_result, detected_entities = self._analyze_entity_density(text, title)
+            density_result, detected_entities = self._analyze_entity_density(
+                page_data.text_content_lower, title_signals
+            )
             breakdown.append(density_result)
         except Exception as e:
             errors.append(f"Entity density check failed: {str(e)}")
@@ -119,7 +190,7 @@ class EntityDetector(BaseDetector):
         # Calculate total dimension score
         total_score = sum(item.weighted_score for item in breakdown)
         
-        return DetectorResult(
+        return self._store_result(page_data, DetectorResult(
             dimension=self.dimension_name,
             score=total_score,
             weight=self.weight,
@@ -131,18 +202,12 @@ class EntityDetector(BaseDetector):
                 "detected_entities_found": breakdown[2].explanation if len(breakdown) > 2 else "", 
                 "detected_entities": detected_entities[:15] # Limit for UI
             }
-        )
+        ))
     
-    def _extract_title(self, html: str) -> str:
+    def _extract_title(self, soup: BeautifulSoup) -> str:
         """
-        Extract the H1 title from HTML using BeautifulSoup.
+        Extract the H1 title from the page's parsed HTML (shared via PageData).
         """
-        if not html:
-            return ""
-            
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'lxml')
-        
         # Try H1 first
         h1 = soup.find('h1')
         if h1:
@@ -155,14 +220,17 @@ class EntityDetector(BaseDetector):
         
         return ""
     
-    def _analyze_power_lead(self, text: str, title: str) -> ScoreBreakdown:
+    def _analyze_power_lead(self, lead: str, signals: _TitleSignals) -> ScoreBreakdown:
         """
         Analyze Power Lead presence.
+        
+        Takes only the first POWER_LEAD_CHAR_LIMIT characters of the page
+        text, so no check here can scan past the lead.
         """
-        first_150_chars = text[:self.POWER_LEAD_CHAR_LIMIT].lower()
+        first_150_chars = lead.lower()
         recommendations = []
         
-        if not title:
+        if not signals.text:
             return ScoreBreakdown(
                 name="Power Lead (Entity in Lead)",
                 raw_score=50.0,
@@ -173,14 +241,8 @@ class EntityDetector(BaseDetector):
             )
         
         # Extract key words from title (exclude stop words - English)
-        stop_words = {
-            'the', 'a', 'an', 'of', 'to', 'in', 'with', 'for', 'and', 'or',
-            'is', 'are', 'was', 'were', 'how', 'what', 'when', 'where', 'why', 'which',
-            'best', 'top', 'guide', 'review', 'vs', 'versus', 'on', 'at', 'by'
-        }
-        
-        title_words = re.findall(r'\b[a-z0-9]+\b', title.lower())
-        key_entities = [w for w in title_words if w not in stop_words and len(w) > 2]
+        title_words = _TITLE_WORD_RE.findall(signals.lower)
+        key_entities = [w for w in title_words if w not in _POWER_LEAD_STOP_WORDS and len(w) > 2]
         
         if not key_entities:
             return ScoreBreakdown(
@@ -197,10 +259,7 @@ class EntityDetector(BaseDetector):
         found_ratio = len(found_entities) / len(key_entities) if key_entities else 0
         
         # Check for declarative structure in first 150 chars (English verbs)
-        has_declarative = bool(re.search(
-            r'\b(is|are|means|refers to|defined as|consists of|offers|provides|allows|announces|launches|reveals|demonstrates|shows)\b',
-            first_150_chars
-        ))
+        has_declarative = bool(_DECLARATIVE_RE.search(first_150_chars))
         
         # Score calculation
         if found_ratio >= 0.8 and has_declarative:
@@ -247,9 +306,10 @@ class EntityDetector(BaseDetector):
             recommendations=recommendations,
         )
     
-    def _analyze_title_entities(self, title: str) -> ScoreBreakdown:
+    def _analyze_title_entities(self, signals: _TitleSignals) -> ScoreBreakdown:
         """Analyze entity presence in the title (English optimized)."""
         recommendations = []
+        title = signals.text
         
         if not title:
             return ScoreBreakdown(
@@ -262,20 +322,16 @@ class EntityDetector(BaseDetector):
             )
         
         # Analyze title characteristics
-        title_lower = title.lower()
+        title_lower = signals.lower
         
         # Check for specificity markers
-        has_number = bool(re.search(r'\d+', title))
-        has_year = bool(re.search(r'20[2-9]\d', title))
-        has_specific_terms = bool(re.search(
-            r'\b(guide|tutorial|step by step|complete|ultimate|best|top|review|example|free|easy|how to|checklist)\b',
-            title_lower
-        ))
+        has_number = bool(_DIGIT_RE.search(title))
+        has_year = bool(_YEAR_RE.search(title))
+        has_specific_terms = bool(_SPECIFIC_TERMS_RE.search(title_lower))
         
         # Check for capitalized words (brands/names) excluding common starters
-        capitalized_words = re.findall(r'\b[A-Z][a-z0-9]+\b', title)
-        common_caps = {'The', 'A', 'An', 'How', 'What', 'Why', 'When', 'Where', 'Is', 'Are', 'Best', 'Top'}
-        brand_like = [w for w in capitalized_words if w not in common_caps]
+        capitalized_words = _CAPITALIZED_WORD_RE.findall(title)
+        brand_like = [w for w in capitalized_words if w not in _COMMON_CAPS]
         
         # Calculate score
         score_factors = []
@@ -287,7 +343,7 @@ class EntityDetector(BaseDetector):
             score_factors.append(("value terms", 25))
         if brand_like:
             score_factors.append((f"entities: {', '.join(brand_like[:3])}", 30))
-        if len(title.split()) >= 4:
+        if len(signals.words) >= 4:
             score_factors.append(("good length", 10))
         
         raw_score = min(100, sum(f[1] for f in score_factors))
@@ -321,12 +377,17 @@ class EntityDetector(BaseDetector):
             recommendations=recommendations,
         )
     
-    def _analyze_entity_density(self, text: str, title: str) -> tuple[ScoreBreakdown, list[str]]:
-        """Analyze entity density throughout content."""
+    def _analyze_entity_density(self, text_lower: str, signals: _TitleSignals) -> tuple[ScoreBreakdown, list[str]]:
+        """
+        Analyze entity density throughout content.
+        
+        Takes the page's lowercased text, which PageData computes once for
+        all detectors.
+        """
         recommendations = []
         found_entities_list = []
         
-        if not title or not text:
+        if not signals.text or not text_lower:
             return ScoreBreakdown(
                 name="Entity Density",
                 raw_score=50.0,
@@ -336,22 +397,13 @@ class EntityDetector(BaseDetector):
                 recommendations=["Ensure content has consistent entity mentions."],
             ), []
         
-        # Extract key entities from title (English stop words)
-        # Expanded Stoplist per user request "Over, The, What, How, About, News, More"
-        stop_words = {
-            'the', 'a', 'an', 'of', 'to', 'in', 'is', 'are', 'how', 'what', 'for', 'with', 'and', 'or',
-            'guide', 'review', 'best', 'top', 'vs', 'over', 'about', 'news', 'more', 'this', 'that',
-            'drives', 'really', 'just', 'from', 'your', 'will', 'can', 'why', 'when', 'where', 'which',
-            'who', 'whose', 'does', 'do', 'should', 'would', 'could', 'has', 'have', 'had', 'been'
-        }
-        
-        whitelist = {"chiliz", "fan token", "socios.com", "bitcoin", "ethereum", "blockchain", "crypto"}
-        
+        # Extract key entities from title (English stop words, _DENSITY_STOP_WORDS)
         # Clean title to list of words using a method that preserves punctuation for "Socios.com"
         # We'll just split by space and strip mild punctuation, or use regex that keeps dots inside words
-        title_words = title.split()
+        title_words = signals.words
         
         key_entities = []
+        seen_entities = set()  # mirrors key_entities for O(1) duplicate checks
         for w in title_words:
             # Clean word: remove trailing/leading punctuation but allow internal dots/hyphens
             clean_w = w.strip(".,;:!?()[]\"'")
@@ -359,14 +411,11 @@ class EntityDetector(BaseDetector):
             
             # CHECK 1: Whitelist (Accept immediately)
             # Check if loose match in whitelist (e.g. "Bitcoin" -> "bitcoin" in whitelist)
-            is_whitelisted = False
-            for wl_item in whitelist:
-                if wl_item in lower_w: # "Can you buy Fan Tokens" -> "Fan Token" in whitelist
-                    is_whitelisted = True
-                    break
+            is_whitelisted = lower_w in _ENTITY_WHITELIST or _ENTITY_WHITELIST_RE.search(lower_w) is not None
             
             if is_whitelisted:
-                if clean_w not in key_entities:
+                if clean_w not in seen_entities:
+                    seen_entities.add(clean_w)
                     key_entities.append(clean_w)
                 continue
                 
@@ -376,9 +425,10 @@ class EntityDetector(BaseDetector):
             # 3. NOT in Stop Words
             if (len(clean_w) > 3 and 
                 clean_w[0].isupper() and 
-                lower_w not in stop_words):
+                lower_w not in _DENSITY_STOP_WORDS):
                 
-                if clean_w not in key_entities:
+                if clean_w not in seen_entities:
+                    seen_entities.add(clean_w)
                     key_entities.append(clean_w)
                     
         # If no entities found after strict check (unlikely for proper titles), fall back to simple
@@ -386,7 +436,7 @@ class EntityDetector(BaseDetector):
              # Just take significant words > 4 chars not in stop words
             for w in title_words:
                 clean_w = w.strip(".,;:!?()[]\"'")
-                if len(clean_w) > 4 and clean_w.lower() not in stop_words:
+                if len(clean_w) > 4 and clean_w.lower() not in _DENSITY_STOP_WORDS:
                      key_entities.append(clean_w)
         
         if not key_entities:
@@ -399,20 +449,58 @@ class EntityDetector(BaseDetector):
                 recommendations=["Use more specific proper nouns (Brand, Product) in title."],
             ), []
         
-        # Count mentions
-        text_lower = text.lower()
+        # Count mentions (simple word bound check)
+        entities_lower = [entity.lower() for entity in key_entities]
+        saturated = False
+        if all(_WORD_TOKEN_RE.fullmatch(e) for e in entities_lower):
+            # Single-word entities: every hit is exactly one whole word, so one
+            # alternation scan counts each entity as its own findall would.
+            # The score tops out at 4 mentions per entity on average. The scan
+            # stops early only once every entity has been seen MENTION_CAP times
+            # and that average is reached: the score is then final and each
+            # entity is reported as "4+", a true lower bound for all of them.
+            # Entities that are not even a substring of the text are left out
+            # of the alternation (str `in` is a fast C search); if none is
+            # present there is nothing to scan.
+            present = [e for e in set(entities_lower) if e in text_lower]
+            # entity_counts below is keyed by entity, so repeated title words count once
+            multiplicity = Counter(entity.lower() for entity in set(key_entities))
+            excellent_total = self.MENTION_CAP * len(key_entities)
+            mention_counts = Counter()
+            running_total = 0
+            # Entities still below the cap; one absent from the text keeps the
+            # scan going to the end, so every count shown is then exact
+            uncapped = set(entities_lower)
+            if present:
+                entities_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, present)) + r')\b')
+                for m in entities_re.finditer(text_lower):
+                    hit = m.group()
+                    mention_counts[hit] += 1
+                    running_total += multiplicity[hit]
+                    if mention_counts[hit] == self.MENTION_CAP:
+                        uncapped.discard(hit)
+                    if not uncapped and running_total >= excellent_total:
+                        saturated = True
+                        break
+        else:
+            # Entities with dots/hyphens (e.g. "socios.com") can overlap each other's hits,
+            # so they are counted one by one; a plain substring test skips the
+            # regex for entities that never occur
+            mention_counts = {
+                e: len(re.findall(rf'\b{re.escape(e)}\b', text_lower))
+                for e in set(entities_lower)
+                if e in text_lower
+            }
+        
         entity_counts = {}
-        for entity in key_entities:
-            # Simple word bound check
-            count = len(re.findall(rf'\b{re.escape(entity.lower())}\b', text_lower))
+        for entity, entity_lower in zip(key_entities, entities_lower):
+            count = mention_counts.get(entity_lower, 0)
             entity_counts[entity] = count
             if count > 0:
-                found_entities_list.append(f"{entity} ({count})")
+                found_entities_list.append(f"{entity} ({f'{self.MENTION_CAP}+' if saturated else count})")
         
         total_mentions = sum(entity_counts.values())
         avg_mentions = total_mentions / len(key_entities) if key_entities else 0
-        word_count = len(text.split())
-        density_ratio = (total_mentions / word_count * 100) if word_count > 0 else 0
         
         if avg_mentions >= 4: # Strict
             raw_score = 100.0
@@ -451,14 +539,3 @@ class EntityDetector(BaseDetector):
             explanation=explanation,
             recommendations=recommendations,
         ), found_entities_list
-    
-    def _create_error_breakdown(self, name: str, weight: float) -> ScoreBreakdown:
-        """Create a zero-score breakdown for failed checks."""
-        return ScoreBreakdown(
-            name=name,
-            raw_score=0.0,
-            weight=weight,
-            weighted_score=0.0,
-            explanation=f"Error analyzing {name}. Score: 0.",
-            recommendations=[f"Manual verification required: {name}."],
-        )
@@ -14,9 +14,12 @@ Implementation uses regex to find claims and DOM analysis for link proximity.
 """
 
 import re
-from typing import List, Tuple
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Any, Dict, List, Optional, Tuple
 from src.models.schemas import PageData, DetectorResult, ScoreBreakdown
 from src.detectors.base_detector import BaseDetector
+from src.utils.text_processing import element_texts_from_tree, iter_sentences
 from config.settings import get_settings
 
 
@@ -54,8 +57,26 @@ class EvidenceDensityDetector(BaseDetector):
         r'\bas stated by \w+',
     ]
     
+    # Result depends only on page HTML/text: memoize re-audits of the same content
+    RESULT_CACHE_SIZE = 32
+    
+    # All claim patterns fused into one case-insensitive alternation (one search per sentence)
+    CLAIM_RE = re.compile("|".join(f"(?:{p})" for p in CLAIM_PATTERNS), re.IGNORECASE)
+    
+    # Every numerical pattern needs a digit. Most sentences have none, and for
+    # those a plain digit scan rules the numerical half out, so only the
+    # authoritative phrasings are left to try.
+    DIGIT_RE = re.compile(r'\d')
+    CLAIM_PHRASE_RE = re.compile(
+        "|".join(f"(?:{p})" for p in CLAIM_PATTERNS if r'\d' not in p), re.IGNORECASE
+    )
+    
+    # Explicit citation markers: [1], (Source: ...)
+    CITATION_RE = re.compile(r'\[\d+\]|\(Source:', re.IGNORECASE)
+    
     def __init__(self):
         """Initialize with settings."""
+        super().__init__()
         self.settings = get_settings()
         
         # Load weights from config if available
@@ -68,12 +89,16 @@ class EvidenceDensityDetector(BaseDetector):
     
     async def analyze(self, page_data: PageData) -> DetectorResult:
         """Analyze evidence density."""
+        cached = self._cached_result(page_data)
+        if cached is not None:
+            return cached
+        
         errors: list[str] = []
         breakdown: list[ScoreBreakdown] = []
         
         # Analyze Claims
         try:
-            claims_result = self._analyze_claims(page_data.html_rendered, page_data.text_content)
+            claims_result = self._analyze_claims(page_data)
             breakdown.append(claims_result)
         except Exception as e:
             errors.append(f"Claim analysis failed: {str(e)}")
@@ -82,38 +107,75 @@ class EvidenceDensityDetector(BaseDetector):
         # Calculate total dimension score
         total_score = sum(item.weighted_score for item in breakdown)
         
-        return DetectorResult(
+        return self._store_result(page_data, DetectorResult(
             dimension=self.dimension_name,
             score=total_score,
             weight=self.weight,
             contribution=self.calculate_contribution(total_score),
             breakdown=breakdown,
             errors=errors,
-        )
+        ))
     
-    def _analyze_claims(self, html: str, text: str) -> ScoreBreakdown:
+    def _analyze_claims(self, page_data: PageData) -> ScoreBreakdown:
         """
         Extract claims and verify against sources.
         Logic:
-        1. Split text into sentences.
+        1. Split the page text into sentences (streamed, not materialized).
         2. Filter sentences that match CLAIM_PATTERNS.
-        3. For each claim, check if the corresponding HTML block contains a link or citation.
+        3. For each claim, check if the corresponding HTML block contains a link or citation
+           (in the parsed HTML shared via PageData, first read when a claim needs it).
         """
         
-        # Simple sentence splitting
-        sentences = re.split(r'(?<=[.!?]) +', text)
-        
         claims: List[Tuple[str, bool]] = [] # (sentence, is_verified)
+        # Candidate elements with their text, collected on the first DOM lookup
+        # and shared by every claim. All texts come from a single tree walk
+        # (per-element get_text() re-walked nested containers once per level).
+        # Whether an element has a link nearby is likewise computed once per element.
+        candidates: Optional[List[Tuple[str, Any]]] = None
+        link_nearby: Dict[int, bool] = {}
         
-        # Prepare BeautifulSoup for robust proximity check
-        from bs4 import BeautifulSoup
-        # Use HTML directly (raw rendered)
-        soup = BeautifulSoup(html, 'html.parser')
+        # DOM verdict per search snippet: repeated claims (boilerplate, quoted
+        # stats) do not search the candidate texts again
+        snippet_verified: Dict[str, bool] = {}
+        
+        # The candidate texts joined by NUL, with the offset where each one
+        # starts, so a snippet is located with str.find() jumps through one
+        # string instead of an `in` test per candidate
+        candidate_blob = ""
+        candidate_starts: List[int] = []
+        
+        def containing(snippet: str):
+            """Yield positions of candidates whose text contains snippet, in order."""
+            if "\0" in snippet:
+                # Could straddle two joined texts: test each candidate instead
+                yield from (i for i, (tag_text, _) in enumerate(candidates) if snippet in tag_text)
+                return
+            offset = candidate_blob.find(snippet)
+            while offset != -1:
+                position = bisect_right(candidate_starts, offset) - 1
+                yield position
+                offset = candidate_blob.find(snippet, candidate_starts[position + 1])
+        
+        def has_link_nearby(tag) -> bool:
+            # Links inside this element
+            if tag.find('a') or 'href=' in str(tag):
+                return True
+            
+            # Check immediate siblings (links often follow or precede paragraphs)
+            for sibling in list(islice(tag.previous_siblings, 2)) + list(islice(tag.next_siblings, 2)):
+                if sibling.name == 'a' or (sibling.name and sibling.find('a')):
+                    return True
+                # Stop if we hit a major block tag that signals a new section
+                if sibling.name in ['h1', 'h2', 'h3', 'hr']:
+                    break
+            return False
         
         # Helper to find if a sentence exists near a link or citation in the DOM
         def is_verified_in_dom(sentence_text: str) -> bool:
+            nonlocal candidates, candidate_blob, candidate_starts
+            
             # 1. Check for explicit citation markers in text
-            if re.search(r'\[\d+\]|\(Source:', sentence_text, re.IGNORECASE):
+            if self.CITATION_RE.search(sentence_text):
                 return True
                 
             # 2. Find the sentence in the DOM and check for nearby links
@@ -122,36 +184,52 @@ class EvidenceDensityDetector(BaseDetector):
             search_snippet = sentence_text[:30].strip()
             if not search_snippet:
                 return False
-                
+            
+            verified = snippet_verified.get(search_snippet)
+            if verified is not None:
+                return verified
+            
+            verified = False
             try:
                 # Find elements whose text content contains the snippet
                 # We start with tags that typically contain article text
-                for tag in soup.find_all(['p', 'li', 'span', 'div']):
-                    if search_snippet in tag.get_text():
-                        # Found the element containing the claim!
-                        # Now check for links inside this element or its siblings
-                        if tag.find('a') or 'href=' in str(tag):
-                            return True
-                        
-                        # Check immediate siblings (links often follow or precede paragraphs)
-                        for sibling in list(tag.previous_siblings)[:2] + list(tag.next_siblings)[:2]:
-                            if sibling.name == 'a' or (sibling.name and sibling.find('a')):
-                                return True
-                            # Stop if we hit a major block tag that signals a new section
-                            if sibling.name in ['h1', 'h2', 'h3', 'hr']:
-                                break
+                if candidates is None:
+                    candidates = element_texts_from_tree(page_data.soup, ['p', 'li', 'span', 'div'])
+                    candidate_blob = "\0".join(tag_text for tag_text, _ in candidates)
+                    candidate_starts = list(accumulate((len(tag_text) + 1 for tag_text, _ in candidates), initial=0))
+                
+                for position in containing(search_snippet):
+                    # Found an element containing the claim
+                    linked = link_nearby.get(position)
+                    if linked is None:
+                        linked = link_nearby[position] = has_link_nearby(candidates[position][1])
+                    if linked:
+                        verified = True
+                        break
             except Exception:
                 pass
-                        
-            return False
+            
+            snippet_verified[search_snippet] = verified
+            return verified
 
-        for sentence in sentences:
+        # Whole-document gate: every numerical claim needs a digit and every
+        # other claim is a phrase match that the full text contains too, so a
+        # page with neither cannot have claims and is not split at all
+        text = page_data.text_content
+        may_have_claims = self.DIGIT_RE.search(text) is not None or self.CLAIM_PHRASE_RE.search(text) is not None
+        
+        for sentence in (iter_sentences(text) if may_have_claims else ()):
+            # Stripping only shortens, so short sentences are dropped before
+            # paying for the strip
+            if len(sentence) < 20:
+                continue
             sentence = sentence.strip()
-            if not sentence or len(sentence) < 20:
+            if len(sentence) < 20:
                 continue
                 
             # Check if sentence is a Claim
-            is_claim = any(re.search(p, sentence, re.IGNORECASE) for p in self.CLAIM_PATTERNS)
+            claim_re = self.CLAIM_RE if self.DIGIT_RE.search(sentence) else self.CLAIM_PHRASE_RE
+            is_claim = claim_re.search(sentence) is not None
             
             if is_claim:
                 is_verified = is_verified_in_dom(sentence)
@@ -212,14 +290,3 @@ class EvidenceDensityDetector(BaseDetector):
             explanation=explanation,
             recommendations=recommendations,
         )
-
-    def _create_error_breakdown(self, name: str, weight: float) -> ScoreBreakdown:
-        """Create a zero-score breakdown for failed checks."""
-        return ScoreBreakdown(
-            name=name,
-            raw_score=0.0,
-            weight=weight,
-            weighted_score=0.0,
-            explanation=f"Error analyzing {name}. Score: 0.",
-            recommendations=[f"Manual verification required: {name}."],
-        )
@@ -8,6 +8,7 @@ Evaluates if content is visually scannable and rich.
 import re
 from src.detectors.base_detector import BaseDetector
 from src.models.schemas import PageData, DetectorResult, ScoreBreakdown
+from src.utils.text_processing import tags_by_name_from_tree
 
 class FormattingDetector(BaseDetector):
     """
@@ -26,25 +27,32 @@ class FormattingDetector(BaseDetector):
     # Text Wall Thresholds - GOLD STANDARD: Raised to 7 lines (~700 chars)
     MAX_CHARS_PER_BLOCK = 700  # Approx 7 lines / 100-120 words
     
+    # Every element the checks below look at, collected in one tree walk
+    FORMAT_TAGS = ('ul', 'ol', 'table', 'p', 'strong', 'b', 'img', 'video', 'iframe', 'embed')
+    
+    # Lists/tables whose attributes mention any of these are navigation/boilerplate.
+    # Matched against the repr of the whole attrs dict (names and values), in one search.
+    LIST_BLACKLIST = ('menu', 'nav', 'social', 'related', 'footer', 'share', 'breadcrumb', 'cookie', 'consent')
+    LIST_BLACKLIST_RE = re.compile('|'.join(LIST_BLACKLIST))
+    
     async def analyze(self, page_data: PageData) -> DetectorResult:
         breakdown = []
         errors = []
         recommendations = []
         
-        from bs4 import BeautifulSoup
-        html = page_data.html_rendered
-        soup = BeautifulSoup(html, 'lxml')
+        # Shared parse of html_rendered (PageData.soup); only read here
+        tags = tags_by_name_from_tree(page_data.soup, self.FORMAT_TAGS)
         
         # 1. Scannability (Lists & Tables) - 40%
         # ----------------------------------------------------------------
         valid_lists = []
         
-        # Find ul, ol, and table
-        for tag in soup.find_all(['ul', 'ol', 'table']):
-            # 1. Class/ID Blacklist
-            attrs_str = str(tag.attrs).lower()
-            blacklist = ['menu', 'nav', 'social', 'related', 'footer', 'share', 'breadcrumb', 'cookie', 'consent']
-            if any(kw in attrs_str for kw in blacklist):
+        # Find ul, ol, and table (only the count of valid ones is used, so
+        # they need not be interleaved in document order)
+        for tag in tags['ul'] + tags['ol'] + tags['table']:
+            # 1. Class/ID Blacklist (a tag without attributes cannot match, so
+            # the attrs repr is only built for tags that have some)
+            if tag.attrs and self.LIST_BLACKLIST_RE.search(str(tag.attrs).lower()):
                 continue
             
             # 2. Structure Check
@@ -53,14 +61,18 @@ class FormattingDetector(BaseDetector):
                 if len(items) <= 3:
                     continue
                 
-                # 3. Quality Check: Average words per item
+                # 3. Quality Check: Average words per item (>= 10, slightly more
+                # lenient for lists). Stop reading items once the total
+                # already guarantees that average.
+                required_words = 10 * len(items)
                 total_words = 0
                 for item in items:
                     clean_item = item.get_text(strip=True)
                     total_words += len(clean_item.split())
+                    if total_words >= required_words:
+                        break
                 
-                avg_words = total_words / len(items) if items else 0
-                if avg_words < 10: # Slightly more lenient for lists
+                if total_words < required_words:
                     continue
             else: # table
                 rows = tag.find_all('tr')
@@ -74,7 +86,7 @@ class FormattingDetector(BaseDetector):
         
         # Check for Text Walls
         text_walls_found = 0
-        for p in soup.find_all('p'):
+        for p in tags['p']:
             clean_text = p.get_text(strip=True)
             if len(clean_text) > self.MAX_CHARS_PER_BLOCK:
                 text_walls_found += 1
@@ -108,7 +120,7 @@ class FormattingDetector(BaseDetector):
         
         # 2. Visual Hierarchy (Bold Highlights) - 30%
         # ----------------------------------------------------------------
-        bold_elements = soup.find_all(['strong', 'b'])
+        bold_elements = tags['strong'] + tags['b']
         
         bold_count = len(bold_elements)
         bold_score = 0.0
@@ -150,8 +162,8 @@ class FormattingDetector(BaseDetector):
         
         # 3. Multimedia Content - 30%
         # ----------------------------------------------------------------
-        img_elements = soup.find_all('img')
-        video_elements = soup.find_all(['video', 'iframe', 'embed'])
+        img_elements = tags['img']
+        video_elements = tags['video'] + tags['iframe'] + tags['embed']
         
         imgs_with_alt = 0
         for img in img_elements:
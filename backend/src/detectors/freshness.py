@@ -70,9 +70,7 @@ class FreshnessDetector(BaseDetector):
         
         # 2. Keyword Relevance (Current Year) (40%)
         # ----------------------------------------------------------------
-        from bs4 import BeautifulSoup
-        html = page_data.html_rendered
-        soup = BeautifulSoup(html, 'lxml')
+        soup = page_data.soup  # shared parse of html_rendered, read-only
         
         # Check Title and H1 for current year
         target_years = [str(self.current_year), str(self.current_year + 1)]
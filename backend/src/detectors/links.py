@@ -48,11 +48,8 @@ class LinksDetector(BaseDetector):
         errors = []
         recommendations = []
         
-        # Parse links from rendered HTML using BeautifulSoup
-        from bs4 import BeautifulSoup
-        html = page_data.html_rendered
-        soup = BeautifulSoup(html, 'lxml')
-        hrefs = [a.get('href', '') for a in soup.find_all('a')]
+        # Links from the rendered HTML (parsed once per page, shared via PageData)
+        hrefs = [a.get('href', '') for a in page_data.soup.find_all('a')]
         
         base_domain = ""
         try:
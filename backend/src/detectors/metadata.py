@@ -50,6 +50,7 @@ class MetadataDetector(BaseDetector):
     
     def __init__(self):
         """Initialize with settings."""
+        super().__init__()
         self.settings = get_settings()
         
         # Load weights from config if available
@@ -244,14 +245,3 @@ class MetadataDetector(BaseDetector):
             explanation=explanation,
             recommendations=recommendations,
         )
-
-    def _create_error_breakdown(self, name: str, weight: float) -> ScoreBreakdown:
-        """Create a zero-score breakdown for failed checks."""
-        return ScoreBreakdown(
-            name=name,
-            raw_score=0.0,
-            weight=weight,
-            weighted_score=0.0,
-            explanation=f"Error analyzing {name}. Score: 0.",
-            recommendations=[f"Manual verification required: {name}."],
-        )
@@ -5,9 +5,13 @@ Data models for the audit system following immutable data principles.
 Each pipeline stage produces new objects, never mutating existing ones.
 """
 
+import hashlib
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, List, Dict, Any
+from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, HttpUrl
+from src.utils.text_processing import parse_html
 
 
 class AuditRequest(BaseModel):
@@ -59,6 +63,40 @@ class PageData(BaseModel):
     is_https: bool = False
     is_ssr: bool = True  # True if SSR, False if CSR
     word_count: int = 0
+    
+    @cached_property
+    def text_content_lower(self) -> str:
+        """
+        Lowercased text_content, computed on first access and shared by
+        every detector that analyzes this page (PageData is never mutated,
+        so the cached value cannot go stale).
+        """
+        return self.text_content.lower()
+    
+    @cached_property
+    def content_digest(self) -> bytes:
+        """
+        Digest of html_rendered and text_content, computed once.
+        
+        A compact key for caches of content-derived results, so they do not
+        keep whole pages alive.
+        """
+        html = self.html_rendered.encode("utf-8", "surrogatepass")
+        digest = hashlib.blake2b(digest_size=32)
+        # Length prefix keeps the (html, text) split unambiguous
+        digest.update(len(html).to_bytes(8, "little"))
+        digest.update(html)
+        digest.update(self.text_content.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+    
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """
+        html_rendered parsed with lxml, on first access, for every detector
+        that only reads the tree. Detectors that prune or modify the DOM
+        must parse their own copy instead.
+        """
+        return parse_html(self.html_rendered)
 
 
 class ScoreBreakdown(BaseModel):
@@ -14,17 +14,40 @@ Key Features:
 Performance Target: Complete scraping in <30s (leaving 30s for analysis per SRS)
 """
 
+import asyncio
+import logging
 import re
 import time
 from datetime import datetime
 from typing import Optional
-from playwright.async_api import async_playwright, Browser, Page, Response
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Response
 
 from src.models.schemas import PageData
 from src.scrapers.base_scraper import BaseScraper, ScraperError
+from src.utils.text_processing import count_normalized_words, extract_clean_text
 from config.settings import get_settings
 
 
+logger = logging.getLogger(__name__)
+
+# Real Human-like Headers
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+CONTEXT_OPTIONS = {
+    "user_agent": USER_AGENT,
+    "viewport": {'width': 1920, 'height': 1080},
+    "extra_http_headers": {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Upgrade-Insecure-Requests": "1"
+    },
+}
+
+
 class PlaywrightScraper(BaseScraper):
     """
     Playwright-based scraper with SSR/CSR detection.
@@ -33,6 +56,11 @@ class PlaywrightScraper(BaseScraper):
     rely on client-side or server-side rendering. This is critical
     for Technical Infrastructure scoring (Layer 1).
     
+    A single browser is launched lazily and shared between scrapes. Each
+    scrape gets a fresh browser context (no cookies, storage, cache,
+    service workers or permissions carried over from earlier audits), and
+    at most pool_size scrapes run at once, so memory stays bounded.
+    
     Example:
         >>> async with PlaywrightScraper() as scraper:
         ...     data = await scraper.scrape("https://stripe.com")
@@ -42,31 +70,36 @@ class PlaywrightScraper(BaseScraper):
     Attributes:
         browser: The Playwright browser instance
         settings: Application settings for timeouts, etc.
+        pool_size: Maximum number of concurrent scrapes
     """
     
-    def __init__(self):
+    def __init__(self, pool_size: Optional[int] = None):
         """Initialize scraper with settings."""
         self.settings = get_settings()
+        self.pool_size = pool_size or self.settings.scraper_pool_size
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._scrape_slots = asyncio.Semaphore(self.pool_size)
+        self._init_lock = asyncio.Lock()
     
     async def _ensure_browser(self) -> Browser:
         """
-        Lazily initialize the browser instance.
+        Lazily initialize the shared browser instance.
         
         Returns:
             Playwright Browser instance
         """
-        if self._browser is None:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-gpu",
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                ]
-            )
+        async with self._init_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        "--disable-gpu",
+                        "--no-sandbox",
+                        "--disable-dev-shm-usage",
+                    ]
+                )
         return self._browser
     
     async def scrape(self, url: str) -> PageData:
@@ -75,7 +108,7 @@ class PlaywrightScraper(BaseScraper):
         
         Performs the following steps:
         1. Fetch raw HTML (without JS execution) via initial response
-        2. Wait for full page render
+        2. Wait for the page to render (load state + optional selector)
         3. Compare raw vs rendered to detect SSR/CSR
         4. Extract text content and metadata
         
@@ -94,22 +127,22 @@ class PlaywrightScraper(BaseScraper):
         
         browser = await self._ensure_browser()
         
-        # Real Human-like Headers
-        user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        
-        context = await browser.new_context(
-            user_agent=user_agent,
-            viewport={'width': 1920, 'height': 1080},
-            extra_http_headers={
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "none",
-                "Sec-Fetch-User": "?1",
-                "Upgrade-Insecure-Requests": "1"
-            }
-        )
+        # Wait for a free slot, then scrape in a context of its own
+        async with self._scrape_slots:
+            context = await browser.new_context(**CONTEXT_OPTIONS)
+            try:
+                return await self._scrape_in_context(context, url)
+            finally:
+                # Closing drops the page and all per-audit state (storage,
+                # cache, service workers, permissions); a crashed context
+                # must not mask the scrape's own error
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning("Failed to close browser context: %s", e)
+    
+    async def _scrape_in_context(self, context: BrowserContext, url: str) -> PageData:
+        """Load and extract url in a new page of the given (fresh) context."""
         page = await context.new_page()
         
         start_time = time.time()
@@ -151,18 +184,25 @@ class PlaywrightScraper(BaseScraper):
             if "Cet Article N'est Pas Encore Disponible" in body_text:
                 raise ScraperError(url, "⛔ Scraper Blocked: Article Not Available (Geo-block/Error)")
 
-            # Wait for full render (network idle)
+            # Wait for render (configurable load state, "domcontentloaded" by default)
             # INCREASED TIMEOUT FOR PRODUCTION STABILITY
             try:
                 await page.wait_for_load_state(
                     self.settings.scraper_wait_until,
                     timeout=self.settings.scraper_timeout_ms
                 )
-                # Additional small grace period for slow SPAs to settle
-                await page.wait_for_timeout(2000) 
+                if self.settings.scraper_post_load_selector:
+                    # Sites that render content via JS: wait for it explicitly
+                    await page.wait_for_selector(
+                        self.settings.scraper_post_load_selector,
+                        timeout=self.settings.scraper_selector_timeout_ms
+                    )
+                else:
+                    # Additional small grace period for slow SPAs to settle
+                    await page.wait_for_timeout(2000) 
             except Exception as e:
-                # If networkidle fails, we still try to proceed with what we have
-                print(f"Warning: wait_for_load_state timed out/failed: {str(e)}")
+                # If the wait fails, we still try to proceed with what we have
+                logger.warning("wait_for_load_state timed out/failed: %s", e)
             
             # Get rendered HTML after JS execution
             html_rendered = await page.content()
@@ -179,8 +219,8 @@ class PlaywrightScraper(BaseScraper):
             # Check HTTPS
             is_https = url.startswith("https://")
             
-            # Calculate word count
-            word_count = len(text_content.split())
+            # Calculate word count (text_content is already whitespace-normalized)
+            word_count = count_normalized_words(text_content)
             
             # Get final URL (after redirects)
             final_url = page.url
@@ -206,15 +246,11 @@ class PlaywrightScraper(BaseScraper):
                 reason=f"Failed to load page: {str(e)}",
                 original_error=e
             )
-        finally:
-            await context.close()
     
     async def _extract_text_content(self, page: Page) -> str:
         """
         Extract visible text content from the page using aggressive cleaning.
         """
-        from src.utils.text_processing import extract_clean_text
-        
         # Get rendered HTML
         html_rendered = await page.content()
         
@@ -1,6 +1,39 @@
 
 import re
-from bs4 import BeautifulSoup
+from typing import Iterator
+from bs4 import BeautifulSoup, Tag
+from bs4.element import CData, NavigableString, PreformattedString
+
+HEADER_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+# String classes Tag.get_text() collects for ordinary content tags
+CONTENT_STRING_TYPES = frozenset({NavigableString, CData})
+
+# Sentence boundary: end punctuation, with the run of spaces after it in group 1
+SENTENCE_END_RE = re.compile(r'[.!?]( +)')
+
+# Elements to remove completely (Technical Noise)
+TECHNICAL_TAGS = ['script', 'style', 'noscript', 'iframe', 'svg', 'form', 'button', 'input', 'textarea', 'select', 'option']
+
+def parse_html(html: str) -> BeautifulSoup:
+    """
+    Parse HTML once with lxml.
+    
+    The *_from_tree helpers below accept the result, so a caller that needs
+    several extractions from the same page only pays for one parse.
+    """
+    return BeautifulSoup(html or "", 'lxml')
+
+def clean_tree_for_analysis(soup: BeautifulSoup) -> BeautifulSoup:
+    """
+    In-place variant of clean_html_for_analysis for an already parsed tree.
+    """
+    # One walk collects every technical element; nested ones are destroyed
+    # together with their already-removed ancestor
+    for element in soup.find_all(TECHNICAL_TAGS):
+        if not element.decomposed:
+            element.decompose()
+    return soup
 
 def clean_html_for_analysis(html: str) -> str:
     """
@@ -13,15 +46,7 @@ def clean_html_for_analysis(html: str) -> str:
     if not html:
         return ""
         
-    soup = BeautifulSoup(html, 'lxml')
-    
-    # Elements to remove completely (Technical Noise)
-    technical_tags = ['script', 'style', 'noscript', 'iframe', 'svg', 'form', 'button', 'input', 'textarea', 'select', 'option']
-    for tag in technical_tags:
-        for element in soup.find_all(tag):
-            element.decompose()
-            
-    return str(soup)
+    return str(clean_tree_for_analysis(parse_html(html)))
 
 def filter_headers_by_text(headers: list[str]) -> list[str]:
     """
@@ -53,13 +78,44 @@ def extract_clean_text(html: str) -> str:
     """
     Extract text content from cleaned HTML using lxml.
     """
-    cleaned_html = clean_html_for_analysis(html)
-    soup = BeautifulSoup(cleaned_html, 'lxml')
-    
-    # Get text and clean whitespace
+    if not html:
+        return ""
+        
+    return extract_clean_text_from_tree(clean_tree_for_analysis(parse_html(html)))
+
+def extract_clean_text_from_tree(soup: BeautifulSoup) -> str:
+    """
+    Extract whitespace-normalized text from a parsed (and usually cleaned) tree.
+    """
+    # Get text and clean whitespace (split/join collapses runs and trims
+    # the ends in one C-level pass, same as re.sub(r'\s+', ' ').strip())
     text = soup.get_text(separator=' ')
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return ' '.join(text.split())
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """
+    Yield the pieces of text between sentence boundaries, lazily.
+    
+    Same pieces as re.split(r'(?<=[.!?]) +', text): the punctuation stays
+    with its sentence, the spaces after it are dropped, nothing is stripped.
+    Matching from the punctuation lets the regex engine skip ahead to
+    candidate characters instead of testing a lookbehind at every offset.
+    """
+    start = 0
+    for match in SENTENCE_END_RE.finditer(text):
+        yield text[start:match.start(1)]
+        start = match.end(1)
+    yield text[start:]
+
+def count_normalized_words(text: str) -> int:
+    """
+    Count words in text already normalized by extract_clean_text.
+    
+    That text has single spaces between words and no leading/trailing
+    whitespace, so the count equals len(text.split()) without building
+    the word list.
+    """
+    return text.count(' ') + 1 if text else 0
 
 def extract_headers(html: str) -> list[dict]:
     """
@@ -69,7 +125,12 @@ def extract_headers(html: str) -> list[dict]:
     if not html:
         return []
         
-    soup = BeautifulSoup(html, 'lxml')
+    return extract_headers_from_tree(parse_html(html))
+
+def extract_headers_from_tree(soup: BeautifulSoup) -> list[dict]:
+    """
+    Extract H1-H3 headers (plus ARIA headings) from a parsed tree.
+    """
     headers = []
     
     # 1. Standard Tags
@@ -102,7 +163,12 @@ def extract_substantive_paragraphs(html: str, min_words: int = 10) -> list[str]:
     if not html:
         return []
         
-    soup = BeautifulSoup(html, 'lxml')
+    return extract_substantive_paragraphs_from_tree(parse_html(html), min_words)
+
+def extract_substantive_paragraphs_from_tree(soup: BeautifulSoup, min_words: int = 10) -> list[str]:
+    """
+    Extract all substantive paragraphs from a parsed tree.
+    """
     paragraphs = []
     
     for p in soup.find_all('p'):
@@ -111,3 +177,79 @@ def extract_substantive_paragraphs(html: str, min_words: int = 10) -> list[str]:
             paragraphs.append(text)
             
     return paragraphs
+
+def count_words_by_section_from_tree(soup: BeautifulSoup) -> list[int]:
+    """
+    Count words per header-delimited section of a parsed tree.
+    
+    Walks the DOM once in document order and starts a new section at every
+    H1-H6 tag (the header's own text belongs to the section it opens).
+    Comments, doctypes and other non-content strings are not counted.
+    """
+    section_word_counts = [0]
+    
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            if node.name in HEADER_TAGS:
+                section_word_counts.append(0)
+        elif not isinstance(node, PreformattedString):
+            section_word_counts[-1] += len(node.split())
+            
+    return section_word_counts
+
+def tags_by_name_from_tree(soup: BeautifulSoup, names) -> dict[str, list[Tag]]:
+    """
+    Collect the elements with each of the given names from a parsed tree.
+    
+    Returns {name: [tags in document order]} with an entry for every name.
+    One plain walk over soup.descendants, much cheaper than a find_all()
+    per name (each of which walks the whole tree through bs4's matcher).
+    """
+    found = {name: [] for name in names}
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            bucket = found.get(node.name)
+            if bucket is not None:
+                bucket.append(node)
+    return found
+
+def element_texts_from_tree(soup: BeautifulSoup, names) -> list[tuple[str, Tag]]:
+    """
+    Pair every element named in `names` with its get_text(), in document order.
+    
+    Equivalent to [(tag.get_text(), tag) for tag in soup.find_all(names)], but
+    the tree is walked once: each element's text is joined from a slice of
+    one shared string list instead of re-walking its descendants, which
+    matters for nested containers (div > div > p ...).
+    """
+    names = frozenset(names)
+    strings = []
+    spans = []  # [tag, first string index, end string index]
+    open_tags = []  # (tag, index into spans or None), innermost last
+    
+    for node in soup.descendants:
+        parent = node.parent
+        while open_tags and open_tags[-1][0] is not parent:
+            _, span_index = open_tags.pop()
+            if span_index is not None:
+                spans[span_index][2] = len(strings)
+        
+        if isinstance(node, Tag):
+            span_index = None
+            if node.name in names:
+                span_index = len(spans)
+                spans.append([node, len(strings), None])
+            open_tags.append((node, span_index))
+        elif type(node) in CONTENT_STRING_TYPES:
+            strings.append(node)
+    
+    for _, span_index in open_tags:
+        if span_index is not None:
+            spans[span_index][2] = len(strings)
+    
+    return [
+        ("".join(strings[start:end]), tag)
+        if tag.interesting_string_types == CONTENT_STRING_TYPES
+        else (tag.get_text(), tag)
+        for tag, start, end in spans
+    ]
@@ -0,0 +1,112 @@
+"""
+Tests for the BaseDetector result cache.
+
+Cached results are keyed on PageData.content_digest, so a wrong key
+would serve one page's score for another.
+"""
+
+import pytest
+
+from src.models.schemas import PageData, DetectorResult
+from src.detectors.base_detector import BaseDetector
+
+
+class CountingDetector(BaseDetector):
+    """Minimal cached detector that counts full analyses."""
+
+    dimension_name = "counting"
+    weight = 0.1
+    RESULT_CACHE_SIZE = 2
+
+    def __init__(self, errors: list[str] = None):
+        super().__init__()
+        self.errors = errors or []
+        self.analyses = 0
+
+    async def analyze(self, page_data: PageData) -> DetectorResult:
+        cached = self._cached_result(page_data)
+        if cached is not None:
+            return cached
+
+        self.analyses += 1
+        score = float(len(page_data.text_content))
+        return self._store_result(page_data, DetectorResult(
+            dimension=self.dimension_name,
+            score=score,
+            weight=self.weight,
+            contribution=self.calculate_contribution(score),
+            breakdown=[],
+            errors=list(self.errors),
+        ))
+
+
+def create_mock_page_data(text: str, html: str = None) -> PageData:
+    """Create a mock PageData for testing."""
+    html = html if html is not None else f"<html><body><p>{text}</p></body></html>"
+    return PageData(
+        url="https://example.com",
+        final_url="https://example.com",
+        html_raw=html,
+        html_rendered=html,
+        text_content=text,
+        status_code=200,
+        load_time_ms=0,
+        word_count=len(text.split()),
+    )
+
+
+class TestResultCache:
+    """Test suite for BaseDetector._cached_result / _store_result."""
+
+    @pytest.mark.asyncio
+    async def test_hit_on_same_content_digest(self):
+        """A separate PageData with identical content is served from cache."""
+        detector = CountingDetector()
+        first = await detector.analyze(create_mock_page_data("alpha"))
+        second = await detector.analyze(create_mock_page_data("alpha"))
+
+        assert second is first
+        assert detector.analyses == 1
+        assert (detector.cache_hits, detector.cache_misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_miss_on_different_content(self):
+        """Pages differing only in html or only in text are not confused."""
+        detector = CountingDetector()
+        await detector.analyze(create_mock_page_data("alpha", html="<p>a</p>"))
+        await detector.analyze(create_mock_page_data("alpha", html="<p>b</p>"))
+        await detector.analyze(create_mock_page_data("beta", html="<p>a</p>"))
+
+        assert detector.analyses == 3
+        assert detector.cache_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """The cache holds RESULT_CACHE_SIZE entries and drops the LRU one."""
+        detector = CountingDetector()
+        await detector.analyze(create_mock_page_data("a"))
+        await detector.analyze(create_mock_page_data("bb"))
+        await detector.analyze(create_mock_page_data("a"))     # hit, "a" now MRU
+        await detector.analyze(create_mock_page_data("ccc"))   # evicts "bb"
+
+        assert len(detector._result_cache) == detector.RESULT_CACHE_SIZE
+        assert detector.analyses == 3
+
+        await detector.analyze(create_mock_page_data("a"))
+        assert detector.analyses == 3
+        await detector.analyze(create_mock_page_data("bb"))
+        assert detector.analyses == 4
+
+    @pytest.mark.asyncio
+    async def test_error_results_not_cached(self):
+        """Results with errors are re-analyzed on the next call."""
+        detector = CountingDetector(errors=["transient failure"])
+        await detector.analyze(create_mock_page_data("alpha"))
+        await detector.analyze(create_mock_page_data("alpha"))
+
+        assert detector.analyses == 2
+        assert len(detector._result_cache) == 0
+
+    def test_cache_is_per_instance(self):
+        """Each detector instance owns its cache."""
+        assert CountingDetector()._result_cache is not CountingDetector()._result_cache
@@ -0,0 +1,102 @@
+"""
+Tests for Settings.from_env.
+
+Pins the environment parsing that replaced pydantic-settings:
+GEO_AUDITOR_<FIELD> overrides, typed conversion and defaults.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from config.settings import ENV_PREFIX, Settings
+
+
+@pytest.fixture(autouse=True)
+def clean_environ(monkeypatch):
+    """Drop any GEO_AUDITOR_* variables inherited from the test runner."""
+    for key in list(os.environ):
+        if key.upper().startswith(ENV_PREFIX):
+            monkeypatch.delenv(key)
+
+
+class TestSettingsFromEnv:
+    """Test suite for Settings.from_env."""
+
+    def test_defaults_without_overrides(self):
+        """No variables and no .env file gives the dataclass defaults."""
+        settings = Settings.from_env(env_file=None)
+
+        assert settings == Settings()
+        assert settings.debug is False
+        assert settings.port == 8000
+        assert settings.openai_api_key is None
+        assert settings.cors_origins == [
+            "http://localhost:3000",
+            "https://carloscanofernandez.com",
+            "http://carloscanofernandez.com",
+        ]
+        assert settings.scoring_weights_path.name == "scoring_weights.json"
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("true", True), ("1", True), ("YES", True), (" on ", True),
+        ("false", False), ("0", False), ("no", False), ("", False),
+    ])
+    def test_bool(self, monkeypatch, raw, expected):
+        monkeypatch.setenv("GEO_AUDITOR_DEBUG", raw)
+
+        assert Settings.from_env(env_file=None).debug is expected
+
+    def test_int(self, monkeypatch):
+        monkeypatch.setenv("GEO_AUDITOR_PORT", "9001")
+        monkeypatch.setenv("GEO_AUDITOR_SCRAPER_POOL_SIZE", "2")
+
+        settings = Settings.from_env(env_file=None)
+
+        assert settings.port == 9001
+        assert settings.scraper_pool_size == 2
+
+    def test_int_rejects_garbage(self, monkeypatch):
+        monkeypatch.setenv("GEO_AUDITOR_PORT", "eighty")
+
+        with pytest.raises(ValueError):
+            Settings.from_env(env_file=None)
+
+    def test_list_is_json(self, monkeypatch):
+        monkeypatch.setenv("GEO_AUDITOR_CORS_ORIGINS", '["https://a.example", "https://b.example"]')
+
+        assert Settings.from_env(env_file=None).cors_origins == [
+            "https://a.example",
+            "https://b.example",
+        ]
+
+    def test_path_and_optional_str(self, monkeypatch, tmp_path):
+        weights = tmp_path / "weights.json"
+        monkeypatch.setenv("GEO_AUDITOR_SCORING_WEIGHTS_PATH", str(weights))
+        monkeypatch.setenv("GEO_AUDITOR_GEMINI_API_KEY", "secret")
+
+        settings = Settings.from_env(env_file=None)
+
+        assert settings.scoring_weights_path == weights
+        assert isinstance(settings.scoring_weights_path, Path)
+        assert settings.gemini_api_key == "secret"
+
+    def test_names_are_case_insensitive(self, monkeypatch):
+        monkeypatch.setenv("geo_auditor_app_name", "Lowercase")
+
+        assert Settings.from_env(env_file=None).app_name == "Lowercase"
+
+    def test_env_file_and_precedence(self, monkeypatch, tmp_path):
+        """Values come from the .env file; the process environment wins."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("GEO_AUDITOR_PORT=7000\nGEO_AUDITOR_HOST=127.0.0.1\n")
+        monkeypatch.setenv("GEO_AUDITOR_PORT", "7001")
+
+        settings = Settings.from_env(env_file=str(env_file))
+
+        assert settings.host == "127.0.0.1"
+        assert settings.port == 7001
+
+    def test_missing_env_file_is_ignored(self, tmp_path):
+        assert Settings.from_env(env_file=str(tmp_path / "missing.env")) == Settings()
@@ -0,0 +1,96 @@
+"""
+Tests for text_processing helpers that replace BeautifulSoup or re
+calls with hand-written equivalents.
+
+Each helper is checked against the library expression it stands in for.
+"""
+
+import re
+
+import pytest
+
+from src.utils.text_processing import parse_html, element_texts_from_tree, iter_sentences
+
+
+EVIDENCE_TAGS = ['p', 'li', 'span', 'div']
+
+HTML_CASES = [
+    # Flat paragraphs
+    "<html><body><p>One.</p><p>Two <b>bold</b> words.</p></body></html>",
+    # Nested containers of the same and different names
+    """
+    <html><body>
+      <div id="outer">Lead
+        <div id="inner"><p>Para with <span>a span</span> and tail</p>
+          <ul><li>Item <span>one</span></li><li>Item two</li></ul>
+        </div>
+        after inner
+      </div>
+      <div><div><div><p>Deep</p></div></div></div>
+    </body></html>
+    """,
+    # Comments, scripts, styles and templates are not content strings
+    """
+    <html><head><style>p { color: red }</style></head><body>
+      <div>Visible<!-- hidden comment --><script>var x = 1;</script>
+        <p>Kept<style>.a{}</style> text</p>
+        <template><p>Template para</p></template>
+      </div>
+    </body></html>
+    """,
+    # Empty elements and elements closing at the end of the document
+    "<div><p></p><span></span><div><li>unclosed",
+    # No matching elements at all
+    "<html><body><h1>Title</h1><table><tr><td>cell</td></tr></table></body></html>",
+    "",
+]
+
+
+class TestElementTextsFromTree:
+    """element_texts_from_tree must match find_all + get_text()."""
+
+    @pytest.mark.parametrize("html", HTML_CASES)
+    def test_matches_find_all_get_text(self, html):
+        soup = parse_html(html)
+        expected = [(tag.get_text(), tag) for tag in soup.find_all(EVIDENCE_TAGS)]
+
+        result = element_texts_from_tree(soup, EVIDENCE_TAGS)
+
+        assert [text for text, _ in result] == [text for text, _ in expected]
+        assert all(a is b for (_, a), (_, b) in zip(result, expected))
+
+    def test_nested_container_text_includes_descendants(self):
+        soup = parse_html("<div>a<div>b<p>c</p>d</div>e</div>")
+
+        result = element_texts_from_tree(soup, ['div', 'p'])
+
+        assert [text for text, _ in result] == ["abcde", "bcd", "c"]
+        assert [tag.name for _, tag in result] == ['div', 'div', 'p']
+
+
+SENTENCE_CASES = [
+    "",
+    "No punctuation at all",
+    "One sentence.",
+    "First. Second! Third? Fourth",
+    "Spaces   after.   Runs of them.  ",
+    "Trailing space. ",
+    "Decimals like 3.5 and e.g. abbreviations. Ellipsis... then more.",
+    "No space after.Punctuation!?Mixed",
+    "Tabs.\tand newlines.\nare not boundaries. Only spaces are.",
+    "?! Leading punctuation. . Lone dots .",
+]
+
+
+class TestIterSentences:
+    """iter_sentences must yield the same pieces as the lookbehind split."""
+
+    @pytest.mark.parametrize("text", SENTENCE_CASES)
+    def test_matches_lookbehind_split(self, text):
+        assert list(iter_sentences(text)) == re.split(r'(?<=[.!?]) +', text)
+
+    def test_is_lazy(self):
+        sentences = iter_sentences("One. Two. Three.")
+
+        assert next(sentences) == "One."
+        assert next(sentences) == "Two."